@@ -54,10 +54,12 @@ else:
                 # Filter data for selected properties
                 comparison_df = properties_df[properties_df['address'].isin(selected_properties)]
                 
-                # Calculate metrics for each property
+                # Calculate metrics for all selected properties in one batch
+                comparison_metrics = st.session_state.property_calculator.calculate_batch_metrics(comparison_df)
+                
                 enhanced_data = []
-                for _, prop in comparison_df.iterrows():
-                    metrics = st.session_state.property_calculator.calculate_comprehensive_metrics(prop)
+                for index, prop in comparison_df.iterrows():
+                    metrics = comparison_metrics.loc[index]
                     
                     enhanced_prop = {
                         'Address': prop['address'],
@@ -101,15 +103,10 @@ else:
                 
                 with col2:
                     # ROI comparison
-                    roi_data = []
-                    for _, prop in comparison_df.iterrows():
-                        metrics = st.session_state.property_calculator.calculate_comprehensive_metrics(prop)
-                        roi_data.append({
-                            'Address': prop['address'],
-                            'ROI': metrics.get('roi', 0)
-                        })
-                    
-                    roi_df = pd.DataFrame(roi_data)
+                    roi_df = pd.DataFrame({
+                        'Address': comparison_df['address'],
+                        'ROI': comparison_metrics['roi']
+                    })
                     fig = px.bar(roi_df, x='Address', y='ROI', title="ROI Comparison")
                     st.plotly_chart(fig, use_container_width=True)
                 
@@ -117,18 +114,13 @@ else:
                 st.markdown("---")
                 st.subheader("💰 Financial Metrics Comparison")
                 
-                metrics_data = []
-                for _, prop in comparison_df.iterrows():
-                    metrics = st.session_state.property_calculator.calculate_comprehensive_metrics(prop)
-                    metrics_data.append({
-                        'Property': prop['address'],
-                        'ROI': metrics.get('roi', 0),
-                        'Cap Rate': metrics.get('cap_rate', 0),
-                        'Cash-on-Cash': metrics.get('cash_on_cash', 0),
-                        'DSCR': metrics.get('dscr', 0)
-                    })
-                
-                metrics_df = pd.DataFrame(metrics_data)
+                metrics_df = pd.DataFrame({
+                    'Property': comparison_df['address'],
+                    'ROI': comparison_metrics['roi'],
+                    'Cap Rate': comparison_metrics['cap_rate'],
+                    'Cash-on-Cash': comparison_metrics['cash_on_cash'],
+                    'DSCR': comparison_metrics['dscr']
+                })
                 
                 # Radar chart for metrics comparison
                 fig = go.Figure()
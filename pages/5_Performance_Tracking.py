@@ -2,9 +2,12 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 import numpy as np
 from datetime import datetime, timedelta
 import random
+import zlib
+from utils.calculations import sum_aligned_series
 
 # Page configuration
 st.set_page_config(
@@ -25,25 +28,79 @@ if 'property_calculator' not in st.session_state:
     from utils.calculations import PropertyCalculator
     st.session_state.property_calculator = PropertyCalculator()
 
+# Cache metrics on the financial inputs so each property is only calculated once
+@st.cache_data(show_spinner=False)
+def get_cached_metrics(_calculator, price, down_payment, loan_amount, interest_rate, loan_term, monthly_rent, monthly_expenses):
+    """Cached comprehensive metrics for a set of property financials"""
+    return _calculator.calculate_comprehensive_metrics({
+        'price': price,
+        'down_payment': down_payment,
+        'loan_amount': loan_amount,
+        'interest_rate': interest_rate,
+        'loan_term': loan_term,
+        'monthly_rent': monthly_rent,
+        'monthly_expenses': monthly_expenses
+    })
+
+def calculate_property_metrics(property_data):
+    """Get comprehensive metrics for a property through the metrics cache"""
+    return get_cached_metrics(
+        st.session_state.property_calculator,
+        property_data.get('price', 0),
+        property_data.get('down_payment', 0),
+        property_data.get('loan_amount', 0),
+        property_data.get('interest_rate', 0),
+        property_data.get('loan_term', 30),
+        property_data.get('monthly_rent', 0),
+        property_data.get('monthly_expenses', 0)
+    )
+
 # Get properties data
 properties_df = st.session_state.data_manager.get_properties()
 
 if properties_df.empty:
     st.info("No properties available for tracking. Add properties in the Property Input page.")
 else:
-    # Generate performance data for demonstration
-    def generate_performance_data(property_data):
-        """Generate historical performance data for a property with cumulative compounding"""
-        start_date = property_data.get('date_acquired', datetime.now() - timedelta(days=365))
+    # Month-end indexes shared by all properties with the same start date
+    tracking_end = pd.Timestamp.now()
+    default_start_date = tracking_end - timedelta(days=365)
+    month_indexes = {}
+    
+    def get_month_index(start_date):
+        """Get the month-end dates from start_date to now, building them once per start date"""
         if isinstance(start_date, str):
             start_date = datetime.strptime(start_date, '%Y-%m-%d')
         
-        months = pd.date_range(start=start_date, end=datetime.now(), freq='ME')
+        if start_date not in month_indexes:
+            # Month arithmetic on datetime64 gives the same dates as date_range(freq='ME')
+            month_starts = np.arange(np.datetime64(start_date, 'M'), np.datetime64(tracking_end, 'M') + 1)
+            month_ends = (month_starts + 1).astype('datetime64[D]') - np.timedelta64(1, 'D')
+            month_indexes[start_date] = month_ends[month_ends <= np.datetime64(tracking_end, 'D')]
+        return month_indexes[start_date]
+    
+    # Generate performance data for demonstration
+    def generate_performance_data(property_data, months=None):
+        """Generate historical performance data for a property with cumulative compounding"""
+        if months is None:
+            months = get_month_index(property_data.get('date_acquired', default_start_date))
         
         performance_data = []
         base_value = property_data['price']
         base_rent = property_data['monthly_rent']
         base_expenses = property_data['monthly_expenses']
+        loan_amount = property_data.get('loan_amount', 0)
+        interest_rate = property_data.get('interest_rate', 0)
+        loan_term = property_data.get('loan_term', 30)
+        
+        # Mortgage payment calculation (fixed monthly payment)
+        monthly_payment = 0
+        if loan_amount > 0:
+            r = interest_rate / 100 / 12
+            n = loan_term * 12
+            if r > 0:
+                monthly_payment = loan_amount * (r * (1 + r)**n) / ((1 + r)**n - 1)
+            else:
+                monthly_payment = loan_amount / n
         
         # Initialize cumulative values
         current_value = base_value
@@ -56,31 +113,27 @@ else:
         annual_rent_growth = 0.03  # 3% annual
         annual_expense_growth = 0.02  # 2% annual
         
+        # Seed per property so reruns reproduce the same history
+        rng = np.random.default_rng(zlib.crc32(str(property_data['address']).encode()))
+        value_shocks = rng.normal(0, 0.02 / np.sqrt(12), len(months))
+        rent_shocks = rng.normal(0, 0.01 / np.sqrt(12), len(months))
+        expense_shocks = rng.normal(0, 0.005 / np.sqrt(12), len(months))
+        
         for i, month in enumerate(months):
             # Monthly appreciation with realistic UK volatility
-            monthly_app_rate = (annual_appreciation_rate / 12) + np.random.normal(0, 0.02 / np.sqrt(12))
+            monthly_app_rate = (annual_appreciation_rate / 12) + value_shocks[i]
             current_value *= (1 + monthly_app_rate)
             
             # Monthly rent growth with volatility
-            monthly_rent_growth = (annual_rent_growth / 12) + np.random.normal(0, 0.01 / np.sqrt(12))
+            monthly_rent_growth = (annual_rent_growth / 12) + rent_shocks[i]
             current_rent *= (1 + monthly_rent_growth)
             
             # Monthly expense growth with smaller volatility
-            monthly_exp_growth = (annual_expense_growth / 12) + np.random.normal(0, 0.005 / np.sqrt(12))
+            monthly_exp_growth = (annual_expense_growth / 12) + expense_shocks[i]
             current_expenses *= (1 + monthly_exp_growth)
             
-            # Calculate monthly cash flow
-            monthly_cash_flow = current_rent - current_expenses
-            
-            # Mortgage payment calculation (fixed monthly payment)
-            if property_data.get('loan_amount', 0) > 0:
-                r = property_data.get('interest_rate', 0) / 100 / 12
-                n = property_data.get('loan_term', 30) * 12
-                if r > 0:
-                    monthly_payment = property_data['loan_amount'] * (r * (1 + r)**n) / ((1 + r)**n - 1)
-                else:
-                    monthly_payment = property_data['loan_amount'] / n
-                monthly_cash_flow -= monthly_payment
+            # Calculate monthly cash flow after the mortgage payment
+            monthly_cash_flow = current_rent - current_expenses - monthly_payment
             
             # Accumulate total cash flow for accurate total return calculation
             total_cash_flow += monthly_cash_flow
@@ -100,6 +153,24 @@ else:
         
         return pd.DataFrame(performance_data)
     
+    def top_n_positions(values, n):
+        """Get the positions of the n largest values in descending order without a full sort"""
+        if len(values) > n:
+            candidates = np.argpartition(values, -n)[-n:]
+        else:
+            candidates = np.arange(len(values))
+        return candidates[np.argsort(-values[candidates], kind='stable')]
+    
+    # Per-property metrics, computed once and shared across tabs
+    property_records = properties_df.to_dict('records')
+    metrics_df = pd.DataFrame(
+        [calculate_property_metrics(prop) for prop in property_records],
+        index=properties_df.index
+    )
+    
+    # Performance histories, generated once per property and reused by every tab and the export
+    performance_by_property = [generate_performance_data(prop) for prop in property_records]
+    
     # Tabs for different performance views
     tab1, tab2, tab3, tab4 = st.tabs(["Portfolio Overview", "Individual Property", "Performance Metrics", "Reports"])
     
@@ -113,18 +184,11 @@ else:
         net_monthly_cash_flow = total_monthly_rent - total_monthly_expenses
         
         # Calculate portfolio metrics
-        portfolio_metrics = []
-        total_equity = 0
-        total_debt = 0
+        total_debt = metrics_df['loan_amount'].sum()
+        total_equity = total_value - total_debt
         
-        for _, prop in properties_df.iterrows():
-            metrics = st.session_state.property_calculator.calculate_comprehensive_metrics(prop)
-            portfolio_metrics.append(metrics)
-            total_equity += prop['price'] - prop.get('loan_amount', 0)
-            total_debt += prop.get('loan_amount', 0)
-        
-        avg_roi = np.mean([m.get('roi', 0) for m in portfolio_metrics])
-        avg_cap_rate = np.mean([m.get('cap_rate', 0) for m in portfolio_metrics])
+        avg_roi = metrics_df['roi'].mean()
+        avg_cap_rate = metrics_df['cap_rate'].mean()
         
         # Display key metrics
         col1, col2, col3, col4 = st.columns(4)
@@ -154,7 +218,7 @@ else:
         with col1:
             # By property type
             if 'property_type' in properties_df.columns:
-                type_values = properties_df.groupby('property_type')['price'].sum()
+                type_values = properties_df.groupby('property_type', observed=True)['price'].sum()
                 fig = px.pie(
                     values=type_values.values,
                     names=type_values.index,
@@ -164,13 +228,13 @@ else:
         
         with col2:
             # By individual property
-            fig = px.bar(
-                properties_df,
-                x='address',
-                y='price',
-                title="Individual Property Values"
+            fig = go.Figure(go.Bar(x=properties_df['address'].values, y=properties_df['price'].values))
+            fig.update_layout(
+                title="Individual Property Values",
+                xaxis_title="Address",
+                yaxis_title="Price",
+                xaxis_tickangle=45
             )
-            fig.update_layout(xaxis_tickangle=45)
             st.plotly_chart(fig, use_container_width=True, key="individual_property_bar")
         
         # Performance over time (aggregate)
@@ -178,23 +242,17 @@ else:
         st.subheader("📈 Portfolio Performance Over Time")
         
         # Generate aggregate performance data
-        all_performance_data = []
-        for _, prop in properties_df.iterrows():
-            prop_performance = generate_performance_data(prop)
-            prop_performance['property_id'] = prop['address']
-            all_performance_data.append(prop_performance)
-        
-        if all_performance_data:
-            # Combine all property data
-            combined_performance = pd.concat(all_performance_data, ignore_index=True)
-            
-            # Aggregate by date
-            portfolio_performance = combined_performance.groupby('date').agg({
-                'property_value': 'sum',
-                'monthly_rent': 'sum',
-                'monthly_cash_flow': 'sum',
-                'annual_cash_flow': 'sum'
-            }).reset_index()
+        all_performance_data = performance_by_property
+        portfolio_dates = max(all_performance_data, key=len)['date'] if all_performance_data else []
+        
+        if len(portfolio_dates):
+            # Every history ends at the current month, so sum the series aligned on their last entry
+            portfolio_performance = pd.DataFrame({'date': portfolio_dates.values})
+            for column in ['property_value', 'monthly_rent', 'monthly_cash_flow', 'annual_cash_flow']:
+                portfolio_performance[column] = sum_aligned_series(
+                    [performance_data[column].to_numpy() for performance_data in all_performance_data],
+                    len(portfolio_dates)
+                )
             
             # Calculate total return
             initial_value = portfolio_performance['property_value'].iloc[0]
@@ -202,36 +260,21 @@ else:
                 (portfolio_performance['property_value'] - initial_value) / initial_value * 100
             )
             
-            col1, col2 = st.columns(2)
+            # Value, cash flow and total return share one figure and date axis
+            fig = make_subplots(
+                rows=3, cols=1,
+                shared_xaxes=True,
+                vertical_spacing=0.08,
+                subplot_titles=("Portfolio Value Over Time", "Monthly Cash Flow Over Time", "Total Return Over Time (%)")
+            )
             
-            with col1:
-                # Portfolio value over time
-                fig = px.line(
-                    portfolio_performance,
-                    x='date',
-                    y='property_value',
-                    title="Portfolio Value Over Time"
-                )
-                st.plotly_chart(fig, use_container_width=True, key="portfolio_value_line")
+            dates = portfolio_performance['date'].values
+            fig.add_trace(go.Scattergl(x=dates, y=portfolio_performance['property_value'].values, mode='lines', name='Portfolio Value'), row=1, col=1)
+            fig.add_trace(go.Scattergl(x=dates, y=portfolio_performance['monthly_cash_flow'].values, mode='lines', name='Monthly Cash Flow'), row=2, col=1)
+            fig.add_trace(go.Scattergl(x=dates, y=portfolio_performance['total_return'].values, mode='lines', name='Total Return (%)'), row=3, col=1)
             
-            with col2:
-                # Cash flow over time
-                fig = px.line(
-                    portfolio_performance,
-                    x='date',
-                    y='monthly_cash_flow',
-                    title="Monthly Cash Flow Over Time"
-                )
-                st.plotly_chart(fig, use_container_width=True, key="portfolio_cashflow_line")
-            
-            # Total return chart
-            fig = px.line(
-                portfolio_performance,
-                x='date',
-                y='total_return',
-                title="Total Return Over Time (%)"
-            )
-            st.plotly_chart(fig, use_container_width=True, key="total_return_line")
+            fig.update_layout(height=900, showlegend=False, hovermode='x unified')
+            st.plotly_chart(fig, use_container_width=True, key="portfolio_performance_subplots")
     
     with tab2:
         st.subheader("🏡 Individual Property Performance")
@@ -285,7 +328,7 @@ else:
             
             with col3:
                 st.markdown("**Key Metrics**")
-                current_metrics = st.session_state.property_calculator.calculate_comprehensive_metrics(property_data)
+                current_metrics = calculate_property_metrics(property_data)
                 
                 st.metric("Current ROI", f"{current_metrics.get('roi', 0):.1f}%")
                 st.metric("Current Cap Rate", f"{current_metrics.get('cap_rate', 0):.1f}%")
@@ -300,40 +343,40 @@ else:
                 
                 with col1:
                     # Property value over time
-                    fig = px.line(
-                        performance_data,
-                        x='date',
-                        y='property_value',
-                        title="Property Value Over Time"
-                    )
+                    fig = go.Figure(go.Scattergl(
+                        x=performance_data['date'].values,
+                        y=performance_data['property_value'].values,
+                        mode='lines'
+                    ))
+                    fig.update_layout(title="Property Value Over Time", xaxis_title="Date", yaxis_title="Property Value")
                     st.plotly_chart(fig, use_container_width=True, key="property_value_chart")
                 
                 with col2:
                     # Monthly cash flow
-                    fig = px.line(
-                        performance_data,
-                        x='date',
-                        y='monthly_cash_flow',
-                        title="Monthly Cash Flow Over Time"
-                    )
+                    fig = go.Figure(go.Scattergl(
+                        x=performance_data['date'].values,
+                        y=performance_data['monthly_cash_flow'].values,
+                        mode='lines'
+                    ))
+                    fig.update_layout(title="Monthly Cash Flow Over Time", xaxis_title="Date", yaxis_title="Monthly Cash Flow")
                     st.plotly_chart(fig, use_container_width=True, key="monthly_cash_flow_chart")
                 
                 # Combined performance chart
                 fig = go.Figure()
                 
                 # Add appreciation line
-                fig.add_trace(go.Scatter(
-                    x=performance_data['date'],
-                    y=performance_data['appreciation'],
+                fig.add_trace(go.Scattergl(
+                    x=performance_data['date'].values,
+                    y=performance_data['appreciation'].values,
                     mode='lines',
                     name='Appreciation (%)',
                     line=dict(color='blue')
                 ))
                 
                 # Add total return line
-                fig.add_trace(go.Scatter(
-                    x=performance_data['date'],
-                    y=performance_data['total_return'],
+                fig.add_trace(go.Scattergl(
+                    x=performance_data['date'].values,
+                    y=performance_data['total_return'].values,
                     mode='lines',
                     name='Total Return (%)',
                     line=dict(color='green')
@@ -354,9 +397,7 @@ else:
         # Calculate performance metrics for all properties
         performance_summary = []
         
-        for _, prop in properties_df.iterrows():
-            performance_data = generate_performance_data(prop)
-            current_metrics = st.session_state.property_calculator.calculate_comprehensive_metrics(prop)
+        for prop, performance_data, current_metrics in zip(property_records, performance_by_property, metrics_df.to_dict('records')):
             
             if not performance_data.empty:
                 current_value = performance_data['property_value'].iloc[-1]
@@ -411,13 +452,13 @@ else:
             
             with col1:
                 # Total return comparison
-                fig = px.bar(
-                    perf_df,
-                    x='Property',
-                    y='Total Return',
-                    title="Total Return by Property"
+                fig = go.Figure(go.Bar(x=perf_df['Property'].values, y=perf_df['Total Return'].values))
+                fig.update_layout(
+                    title="Total Return by Property",
+                    xaxis_title="Property",
+                    yaxis_title="Total Return",
+                    xaxis_tickangle=45
                 )
-                fig.update_layout(xaxis_tickangle=45)
                 st.plotly_chart(fig, use_container_width=True)
             
             with col2:
@@ -489,8 +530,7 @@ else:
                 
                 # Create monthly performance data
                 monthly_data = []
-                for _, prop in properties_df.iterrows():
-                    performance_data = generate_performance_data(prop)
+                for prop, performance_data in zip(property_records, performance_by_property):
                     if not performance_data.empty:
                         # Get last 12 months
                         recent_data = performance_data.tail(12)
@@ -545,8 +585,7 @@ else:
                 
                 # Calculate annual performance for each property
                 annual_performance = []
-                for _, prop in properties_df.iterrows():
-                    performance_data = generate_performance_data(prop)
+                for prop, performance_data in zip(property_records, performance_by_property):
                     if not performance_data.empty:
                         current_value = performance_data['property_value'].iloc[-1]
                         initial_value = performance_data['property_value'].iloc[0]
@@ -575,43 +614,36 @@ else:
                     st.dataframe(display_annual, use_container_width=True)
                     
                     # Annual performance chart
-                    fig = px.bar(
-                        annual_df,
-                        x='Property',
-                        y='Total Return',
-                        title="Annual Total Return by Property"
+                    fig = go.Figure(go.Bar(x=annual_df['Property'].values, y=annual_df['Total Return'].values))
+                    fig.update_layout(
+                        title="Annual Total Return by Property",
+                        xaxis_title="Property",
+                        yaxis_title="Total Return",
+                        xaxis_tickangle=45
                     )
-                    fig.update_layout(xaxis_tickangle=45)
                     st.plotly_chart(fig, use_container_width=True, key="annual_return_bar")
             
             elif report_type == "Property Comparison":
                 st.markdown("**Property Comparison Report**")
                 
-                # Create comparison metrics
-                comparison_data = []
-                for _, prop in properties_df.iterrows():
-                    metrics = st.session_state.property_calculator.calculate_comprehensive_metrics(prop)
-                    performance_data = generate_performance_data(prop)
-                    
-                    if not performance_data.empty:
-                        total_return = performance_data['total_return'].iloc[-1]
-                    else:
-                        total_return = 0
-                    
-                    comparison_data.append({
-                        'Property': prop['address'],
-                        'Type': prop['property_type'],
-                        'Price': prop['price'],
-                        'Monthly Rent': prop['monthly_rent'],
-                        'ROI': metrics.get('roi', 0),
-                        'Cap Rate': metrics.get('cap_rate', 0),
-                        'Cash Flow': metrics.get('monthly_cash_flow', 0),
-                        'Total Return': total_return
-                    })
+                # Create comparison metrics from the shared metrics frame
+                total_return_series = pd.Series([
+                    performance_data['total_return'].iloc[-1] if not performance_data.empty else 0
+                    for performance_data in performance_by_property
+                ], index=properties_df.index, dtype=float)
                 
-                if comparison_data:
-                    comp_df = pd.DataFrame(comparison_data)
-                    
+                comp_df = pd.DataFrame({
+                    'Property': properties_df['address'].values,
+                    'Type': properties_df['property_type'].values,
+                    'Price': properties_df['price'].values,
+                    'Monthly Rent': properties_df['monthly_rent'].values,
+                    'ROI': metrics_df['roi'].values,
+                    'Cap Rate': metrics_df['cap_rate'].values,
+                    'Cash Flow': metrics_df['monthly_cash_flow'].values,
+                    'Total Return': total_return_series.values
+                })
+                
+                if not comp_df.empty:
                     # Ranking by different metrics
                     st.markdown("**Property Rankings**")
                     
@@ -619,12 +651,12 @@ else:
                     
                     with col1:
                         st.markdown("**Top Properties by ROI**")
-                        roi_ranking = comp_df.nlargest(5, 'ROI')[['Property', 'ROI']]
+                        roi_ranking = comp_df.iloc[top_n_positions(comp_df['ROI'].to_numpy(), 5)][['Property', 'ROI']]
                         st.dataframe(roi_ranking, use_container_width=True)
                     
                     with col2:
                         st.markdown("**Top Properties by Cash Flow**")
-                        cash_flow_ranking = comp_df.nlargest(5, 'Cash Flow')[['Property', 'Cash Flow']]
+                        cash_flow_ranking = comp_df.iloc[top_n_positions(comp_df['Cash Flow'].to_numpy(), 5)][['Property', 'Cash Flow']]
                         st.dataframe(cash_flow_ranking, use_container_width=True)
                     
                     # Comparison visualization
@@ -648,35 +680,30 @@ else:
         
         with col1:
             if st.button("Export to CSV"):
-                # Create comprehensive export data
-                export_data = []
-                for _, prop in properties_df.iterrows():
-                    metrics = st.session_state.property_calculator.calculate_comprehensive_metrics(prop)
-                    performance_data = generate_performance_data(prop)
-                    
-                    if not performance_data.empty:
-                        current_value = performance_data['property_value'].iloc[-1]
-                        total_return = performance_data['total_return'].iloc[-1]
-                    else:
-                        current_value = prop['price']
-                        total_return = 0
-                    
-                    export_data.append({
-                        'Address': prop['address'],
-                        'Property Type': prop['property_type'],
-                        'Purchase Price': prop['price'],
-                        'Current Value': current_value,
-                        'Monthly Rent': prop['monthly_rent'],
-                        'Monthly Expenses': prop['monthly_expenses'],
-                        'ROI': metrics.get('roi', 0),
-                        'Cap Rate': metrics.get('cap_rate', 0),
-                        'Monthly Cash Flow': metrics.get('monthly_cash_flow', 0),
-                        'Total Return': total_return,
-                        'Date Acquired': prop.get('date_acquired', '')
-                    })
+                # Create comprehensive export data from the shared metrics and performance histories
+                current_values = np.array([
+                    performance_data['property_value'].iloc[-1] if not performance_data.empty else price
+                    for performance_data, price in zip(performance_by_property, properties_df['price'])
+                ], dtype=float)
+                total_returns = np.array([
+                    performance_data['total_return'].iloc[-1] if not performance_data.empty else 0
+                    for performance_data in performance_by_property
+                ], dtype=float)
                 
-                export_df = pd.DataFrame(export_data)
-                csv = export_df.to_csv(index=False)
+                export_df = pd.DataFrame({
+                    'Address': properties_df['address'].values,
+                    'Property Type': properties_df['property_type'].values,
+                    'Purchase Price': properties_df['price'].values,
+                    'Current Value': current_values,
+                    'Monthly Rent': properties_df['monthly_rent'].values,
+                    'Monthly Expenses': properties_df['monthly_expenses'].values,
+                    'ROI': metrics_df['roi'].values,
+                    'Cap Rate': metrics_df['cap_rate'].values,
+                    'Monthly Cash Flow': metrics_df['monthly_cash_flow'].values,
+                    'Total Return': total_returns,
+                    'Date Acquired': properties_df['date_acquired'].values if 'date_acquired' in properties_df.columns else ''
+                })
+                csv = export_df.to_csv(index=False, lineterminator='\n')
                 
                 st.download_button(
                     label="Download CSV",
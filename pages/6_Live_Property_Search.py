@@ -1,9 +1,8 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
 from datetime import datetime
-import uuid
+from utils.calculations import summarize_price_yield, calculate_display_metrics
 
 # Page configuration
 st.set_page_config(
@@ -24,20 +23,55 @@ if 'property_calculator' not in st.session_state:
     from utils.calculations import PropertyCalculator
     st.session_state.property_calculator = PropertyCalculator()
 
-from utils.property_data_sources import PropertyDataSources
-
 # Initialize property data sources
 if 'property_sources' not in st.session_state:
+    from utils.property_data_sources import PropertyDataSources
     st.session_state.property_sources = PropertyDataSources()
 
-# Check API availability
-api_status = st.session_state.property_sources.check_api_availability()
+# Check API availability - the keys only change on redeploy, so the probe is cached
+@st.cache_data(ttl=300, show_spinner=False)
+def get_api_status(_sources):
+    """Cached API availability for the property data sources"""
+    return _sources.check_api_availability()
+
+# Cache search results on their criteria - dicts are frozen into sorted tuples so they can be hashed
+def freeze_criteria(criteria):
+    """Convert a criteria dict into a hashable, order-independent tuple"""
+    return tuple(sorted(
+        (key, tuple(value) if isinstance(value, list) else value)
+        for key, value in criteria.items()
+    ))
+
+@st.cache_data(ttl=600, show_spinner=False)
+def cached_discover_deals(_sources, criteria_key):
+    """Cached investment deal discovery for a frozen criteria tuple"""
+    return _sources.discover_investment_deals(dict(criteria_key))
 
-# Display API status
-st.sidebar.markdown("### API Status")
-for api_name, is_available in api_status.items():
-    status_icon = "✅" if is_available else "❌"
-    st.sidebar.markdown(f"{status_icon} {api_name}")
+@st.cache_data(ttl=600, show_spinner=False)
+def cached_search_local_market(_sources, target_address, params_key):
+    """Cached local market search for a frozen search parameter tuple"""
+    return _sources.search_local_market(target_address, dict(params_key))
+
+@st.cache_data(ttl=600, show_spinner=False)
+def cached_search_all_sources(_sources, location, max_results_per_source):
+    """Cached search across all available data sources"""
+    return _sources.search_all_sources(location=location, max_results_per_source=max_results_per_source)
+
+# Display API status - as a fragment, refreshing it does not rerun the search tabs
+@st.fragment
+def render_api_status():
+    """Render the API status list with a refresh control"""
+    st.markdown("### API Status")
+    st.button("🔄 Refresh API Status", on_click=get_api_status.clear)
+    
+    for api_name, is_available in get_api_status(st.session_state.property_sources).items():
+        status_icon = "✅" if is_available else "❌"
+        st.markdown(f"{status_icon} {api_name}")
+
+with st.sidebar:
+    render_api_status()
+
+api_status = get_api_status(st.session_state.property_sources)
 
 if not any(api_status.values()):
     st.warning("⚠️ No API keys configured. You'll need API keys to access live property data.")
@@ -66,6 +100,277 @@ if not any(api_status.values()):
         - `LAND_REGISTRY_API_KEY`
         """)
 
+# Deal column and direction used for each "Sort Results By" option
+DEAL_SORT_COLUMNS = {
+    "Deal Score": ('deal_score', False),
+    "Rental Yield": ('rental_yield', False),
+    "Price (Low to High)": ('price', True),
+    "Cash Flow": ('estimated_cash_flow', False)
+}
+
+# Summary metrics only change with the results they are built from, not on widget reruns
+@st.cache_data(ttl=600, show_spinner=False)
+def summarize_deals(_deals, criteria_key, deal_ids):
+    """Cached deal averages, excellent-deal count and top-ten indices for the chosen sort"""
+    summary_df = pd.DataFrame(_deals).reindex(
+        columns=['deal_score', 'rental_yield', 'price', 'estimated_cash_flow']
+    ).fillna(0)
+    summary_means = summary_df.mean()
+    
+    # Select the top deals by the chosen sort without sorting every result
+    sort_column, ascending = DEAL_SORT_COLUMNS[dict(criteria_key)['sort_by']]
+    select_top = summary_df.nsmallest if ascending else summary_df.nlargest
+    
+    return (
+        float(summary_means['deal_score']),
+        float(summary_means['rental_yield']),
+        float(summary_means['price']),
+        float(summary_means['estimated_cash_flow']),
+        int((summary_df['deal_score'] >= 80).sum()),
+        select_top(10, sort_column).index.tolist()
+    )
+
+# Portfolio records for discovered deals - cached on the deal fields they are built from
+DEAL_PROPERTY_FIELDS = (
+    'address', 'property_type', 'price', 'monthly_rent', 'estimated_monthly_expenses',
+    'bedrooms', 'bathrooms', 'square_feet', 'year_built', 'source', 'deal_score', 'deal_quality'
+)
+
+def freeze_deal(deal):
+    """Reduce a deal to a hashable tuple of the fields used for its portfolio record"""
+    return tuple((field, deal[field]) for field in DEAL_PROPERTY_FIELDS if field in deal)
+
+@st.cache_data(show_spinner=False)
+def deal_to_property(deal_key):
+    """Cached portfolio record for a frozen deal, without its id and acquisition date"""
+    deal = dict(deal_key)
+    return {
+        'address': deal.get('address', ''),
+        'property_type': deal.get('property_type', 'Unknown'),
+        'price': deal.get('price', 0),
+        'monthly_rent': deal.get('monthly_rent', 0),
+        'monthly_expenses': deal.get('estimated_monthly_expenses', deal.get('price', 0) * 0.01),
+        'loan_amount': deal.get('price', 0) * 0.75,
+        'down_payment': deal.get('price', 0) * 0.25,
+        'interest_rate': 5.5,
+        'loan_term': 25,
+        'bedrooms': deal.get('bedrooms', 0),
+        'bathrooms': deal.get('bathrooms', 0),
+        'square_feet': deal.get('square_feet', 0),
+        'year_built': deal.get('year_built', 1990),
+        'source': f"Deal Discovery - {deal.get('source', 'Unknown')}",
+        'notes': f"Deal Score: {deal.get('deal_score', 0):.1f}/100. Quality: {deal.get('deal_quality', 'Unknown')}."
+    }
+
+# Top deal cards - as a fragment, an Add to Portfolio click reruns only these cards
+@st.fragment
+def render_top_deals(deals):
+    """Render the top five deals as expanders with an Add to Portfolio action"""
+    for i, deal in enumerate(deals[:5]):
+        # Fields shown more than once are read from the deal a single time
+        address = deal.get('address', 'N/A')
+        price = deal.get('price', 0)
+        rental_yield = deal.get('rental_yield', 0)
+        deal_quality = deal.get('deal_quality', 'Unknown')
+        
+        with st.expander(
+            f"{deal_quality} - {address} - £{price:,.0f} ({rental_yield:.1f}% yield)",
+            expanded=i < 2
+        ):
+            col1, col2, col3 = st.columns([2, 2, 1])
+            
+            with col1:
+                st.markdown("\n\n".join([
+                    f"**📍 Address:** {address}",
+                    f"**🏠 Type:** {deal.get('property_type', 'N/A')}",
+                    f"**💰 Price:** £{price:,.0f}",
+                    f"**📊 Deal Score:** {deal.get('deal_score', 0):.1f}/100"
+                ]))
+            
+            with col2:
+                cash_flow = deal.get('estimated_cash_flow', 0)
+                st.markdown("\n\n".join([
+                    f"**🛏️ Bedrooms:** {deal.get('bedrooms', 'N/A')}",
+                    f"**📈 Yield:** {rental_yield:.1f}%",
+                    f"**£ Monthly Rent:** £{deal.get('monthly_rent', 0):,}",
+                    f"**💵 Cash Flow:** £{cash_flow:,}/month"
+                ]))
+            
+            with col3:
+                st.metric("Quality", deal_quality)
+                
+                # Action button
+                if st.button(f"➕ Add to Portfolio", key=f"add_deal_{deal.get('id', '')}_{i}"):
+                    if 'data_manager' in st.session_state:
+                        import uuid
+                        
+                        property_data = deal_to_property(freeze_deal(deal))
+                        property_data['id'] = deal.get('id', f"deal_{uuid.uuid4().hex[:8]}")
+                        property_data['date_acquired'] = datetime.now().strftime('%Y-%m-%d')
+                        
+                        if st.session_state.data_manager.add_property(property_data):
+                            st.success("✅ Added to portfolio!")
+
+# Auto Compare holds property ids, resolved through one id-keyed property index,
+# plus the queued properties' fields as columns for the selection grid and analysis
+AUTO_COMPARE_COLUMNS = [
+    'id', 'address', 'property_type', 'price', 'monthly_rent', 'rental_yield',
+    'bedrooms', 'bathrooms', 'square_feet', 'source'
+]
+
+def build_auto_compare_frame(properties):
+    """Columnar frame of the Auto Compare fields, one row per queued property"""
+    return pd.DataFrame.from_records(properties, columns=AUTO_COMPARE_COLUMNS)
+
+def queue_auto_compare(properties):
+    """Index properties by id and queue their ids for the Auto Compare tab"""
+    st.session_state.setdefault('property_index', {}).update(
+        (prop['id'], prop) for prop in properties
+    )
+    st.session_state.auto_compare_ids = [prop['id'] for prop in properties]
+    st.session_state.auto_compare_df = build_auto_compare_frame(properties)
+
+# Search result selection is held as one set of property ids; bulk changes start a fresh
+# results grid so its Select column is rebuilt from the set
+def set_result_selection(selected_ids):
+    """Replace the selected id set and reset the results grid to it"""
+    st.session_state.selected_prop_ids = set(selected_ids)
+    st.session_state.results_grid_version = st.session_state.get('results_grid_version', 0) + 1
+
+def set_search_results(results, timestamp):
+    """Replace the current search results and start them with nothing selected"""
+    st.session_state.search_results = results
+    st.session_state.search_timestamp = timestamp
+    set_result_selection([])
+
+# Result ids repeat between searches (demo data is always uk_market_0..N), so the results table
+# and grid are keyed on the row content that identifies what is shown
+def results_content_key(results):
+    """Hashable key of the identifying fields of every search result"""
+    return tuple(
+        (prop.get('id'), prop.get('address'), prop.get('price'), prop.get('monthly_rent'), prop.get('source'))
+        for prop in results
+    )
+
+@st.cache_data(ttl=600, show_spinner=False)
+def build_results_table(_results, results_key):
+    """Cached display table for a set of search results, with gross yield and its UK rating"""
+    results_df = pd.DataFrame.from_records(_results, columns=[
+        'address', 'property_type', 'price', 'monthly_rent', 'bedrooms', 'bathrooms',
+        'square_feet', 'postcode', 'tenure', 'source', 'listing_url'
+    ])
+    
+    return results_df.join(calculate_display_metrics(results_df['price'], results_df['monthly_rent']))
+
+# Selection analysis frames are cached on the field values they are built from
+@st.cache_data(show_spinner=False)
+def build_yield_analysis(prop_rows):
+    """Cached gross yield table for (address, price, monthly rent, source) rows with a price and rent"""
+    analysis_df = pd.DataFrame.from_records(
+        prop_rows, columns=['Address', 'Price', 'Monthly Rent', 'Source']
+    ).astype({'Price': 'float64', 'Monthly Rent': 'float64', 'Source': 'category'})
+    analysis_df = analysis_df[(analysis_df['Price'] > 0) & (analysis_df['Monthly Rent'] > 0)].reset_index(drop=True)
+    analysis_df.insert(3, 'Gross Yield', analysis_df['Monthly Rent'] * 12 / analysis_df['Price'] * 100)
+    return analysis_df
+
+@st.cache_data(show_spinner=False)
+def build_quick_comparison(prop_rows):
+    """Cached numeric frame and comparison table for (address, price, rent, yield, type) rows"""
+    analysis_df = pd.DataFrame(
+        list(prop_rows), columns=['address', 'price', 'monthly_rent', 'rental_yield', 'property_type']
+    )
+    comparison_df = pd.DataFrame({
+        'Address': analysis_df['address'].str.slice(0, 30) + '...',
+        'Price': analysis_df['price'],
+        'Monthly Rent': analysis_df['monthly_rent'],
+        'Gross Yield': analysis_df['rental_yield'],
+        'Property Type': analysis_df['property_type']
+    })
+    return analysis_df, comparison_df
+
+# Scatter plots switch to the WebGL renderer above this many points
+WEBGL_POINT_THRESHOLD = 1000
+
+# Saved searches keep their results as Parquet bytes rather than lists of property dicts.
+# Sources return different fields, so the columns are the union of every result's keys, and
+# fields Parquet cannot hold as one typed column (nested, or mixed str and number) go in as JSON text
+def pack_search_results(results):
+    """Serialize search results to an in-memory Parquet blob"""
+    import json
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    columns = {}
+    json_columns = []
+    for key in dict.fromkeys(key for prop in results for key in prop):
+        values = [prop.get(key) for prop in results]
+        try:
+            if any(isinstance(value, (dict, list)) for value in values):
+                raise TypeError(f"{key} holds nested values")
+            columns[key] = pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+            columns[key] = pa.array(
+                [None if value is None else json.dumps(value, default=str) for value in values], pa.string()
+            )
+            json_columns.append(key)
+    
+    table = pa.table(columns).replace_schema_metadata({'json_columns': json.dumps(json_columns)})
+    buffer = pa.BufferOutputStream()
+    pq.write_table(table, buffer)
+    return buffer.getvalue().to_pybytes()
+
+def unpack_search_results(blob):
+    """Restore search results from a Parquet blob, dropping fields a property never had"""
+    import json
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    table = pq.read_table(pa.BufferReader(blob))
+    json_columns = set(json.loads((table.schema.metadata or {}).get(b'json_columns', b'[]')))
+    return [
+        {
+            key: json.loads(value) if key in json_columns else value
+            for key, value in row.items() if value is not None
+        }
+        for row in table.to_pylist()
+    ]
+
+# The saved search list renders from a small summary frame indexed by search name,
+# so only Load Search touches a stored result payload
+def save_search(search_name, results, timestamp, location):
+    """Store search results under a name and record the search in the summary frame"""
+    st.session_state.setdefault('saved_searches', {})[search_name] = {
+        'blob': pack_search_results(results),
+        'timestamp': timestamp,
+        'location': location
+    }
+    
+    # The display string is formatted once here rather than on every render
+    saved_at = pd.Timestamp(timestamp)
+    if 'saved_searches_summary' not in st.session_state:
+        st.session_state.saved_searches_summary = pd.DataFrame(
+            columns=['location', 'n_props', 'timestamp', 'timestamp_str']
+        )
+    summary = st.session_state.saved_searches_summary
+    summary.loc[search_name] = [location, len(results), saved_at, saved_at.strftime('%Y-%m-%d %H:%M')]
+    summary['timestamp'] = pd.to_datetime(summary['timestamp'])
+
+# Saved search and Auto Compare state changes run as button callbacks, so no second rerun is needed
+def load_saved_search(search_name):
+    """Make a saved search the current search results"""
+    search_data = st.session_state.saved_searches[search_name]
+    set_search_results(unpack_search_results(search_data['blob']), search_data['timestamp'])
+
+def delete_saved_search(search_name):
+    """Remove a saved search and its summary row"""
+    del st.session_state.saved_searches[search_name]
+    st.session_state.saved_searches_summary.drop(index=search_name, inplace=True)
+
+def clear_auto_compare():
+    """Drop the properties queued for Auto Compare"""
+    st.session_state.pop('auto_compare_ids', None)
+    st.session_state.pop('auto_compare_df', None)
+
 # Enhanced tabs with deal discovery
 tab1, tab2, tab3, tab4, tab5 = st.tabs(["🎯 Deal Discovery", "Address Search", "Area Search", "Search Results", "Auto Compare"])
 
@@ -135,137 +440,95 @@ with tab1:
             use_container_width=True
         )
         
-        if submitted:
-            criteria = {
-                'location': location,
-                'property_types': property_types,
-                'min_bedrooms': min_bedrooms,
-                'max_bedrooms': max_bedrooms,
-                'min_price': min_price,
-                'max_price': max_price,
-                'min_yield': min_yield,
-                'min_cash_flow': min_cash_flow,
-                'max_results': max_results,
-                'sort_by': sort_by,
-                'include_analysis': include_analysis,
-                'auto_compare': auto_compare
-            }
+    if submitted:
+        criteria = {
+            'location': location,
+            'property_types': property_types,
+            'min_bedrooms': min_bedrooms,
+            'max_bedrooms': max_bedrooms,
+            'min_price': min_price,
+            'max_price': max_price,
+            'min_yield': min_yield,
+            'min_cash_flow': min_cash_flow,
+            'max_results': max_results,
+            'sort_by': sort_by,
+            'include_analysis': include_analysis,
+            'auto_compare': auto_compare
+        }
+        
+        criteria_key = freeze_criteria(criteria)
+        
+        with st.spinner("🔍 Discovering investment deals..."):
+            # Resubmitting unchanged criteria reuses the last discovery instead of searching again
+            if st.session_state.get('last_deal_key') == criteria_key and 'discovered_deals' in st.session_state:
+                deals = st.session_state.discovered_deals
+            else:
+                deals = cached_discover_deals(st.session_state.property_sources, criteria_key)
             
-            with st.spinner("🔍 Discovering investment deals..."):
-                deals = st.session_state.property_sources.discover_investment_deals(criteria)
+            if deals:
+                st.session_state.discovered_deals = deals
+                st.session_state.deal_criteria = criteria
+                st.session_state.last_deal_key = criteria_key
+                
+                # Display results
+                st.success(f"🎉 Found {len(deals)} investment deals matching your criteria!")
+                
+                # Summary metrics and top deal picks, cached on the criteria and deal ids
+                deal_ids = tuple(deal.get('id', str(i)) for i, deal in enumerate(deals))
+                (avg_deal_score, avg_yield, avg_price, avg_cash_flow,
+                 excellent_deals, top_indices) = summarize_deals(deals, criteria_key, deal_ids)
+                
+                col1, col2, col3, col4, col5 = st.columns(5)
+                
+                with col1:
+                    st.metric("Avg Deal Score", f"{avg_deal_score:.1f}/100")
+                
+                with col2:
+                    st.metric("Avg Yield", f"{avg_yield:.1f}%")
+                
+                with col3:
+                    st.metric("Avg Price", f"£{avg_price:,.0f}")
+                
+                with col4:
+                    st.metric("Avg Cash Flow", f"£{avg_cash_flow:,.0f}")
+                
+                with col5:
+                    st.metric("Excellent Deals", excellent_deals)
+                
+                top_deals = [deals[i] for i in top_indices]
+                
+                # Top 5 deals preview
+                st.markdown("### 🏆 Top Investment Deals")
+                
+                render_top_deals(top_deals)
+                
+                # Auto-populate comparison if enabled
+                if criteria.get('auto_compare', False) and len(deals) >= 2:
+                    queue_auto_compare(top_deals)
+                    st.success("🔥 Top deals auto-selected for comparison! Check the 'Auto Compare' tab.")
+                
+                # Show all deals button
+                if st.button("📄 View All Deals", use_container_width=True):
+                    st.session_state['show_all_deals'] = True
+                    st.rerun()
+            else:
+                st.warning("No deals found matching your criteria. Try adjusting your filters.")
                 
-                if deals:
-                    st.session_state.discovered_deals = deals
-                    st.session_state.deal_criteria = criteria
-                    
-                    # Display results
-                    st.success(f"🎉 Found {len(deals)} investment deals matching your criteria!")
-                    
-                    # Summary metrics
-                    col1, col2, col3, col4, col5 = st.columns(5)
-                    
-                    with col1:
-                        avg_deal_score = sum(d.get('deal_score', 0) for d in deals) / len(deals)
-                        st.metric("Avg Deal Score", f"{avg_deal_score:.1f}/100")
-                    
-                    with col2:
-                        avg_yield = sum(d.get('rental_yield', 0) for d in deals) / len(deals)
-                        st.metric("Avg Yield", f"{avg_yield:.1f}%")
-                    
-                    with col3:
-                        avg_price = sum(d.get('price', 0) for d in deals) / len(deals)
-                        st.metric("Avg Price", f"£{avg_price:,.0f}")
-                    
-                    with col4:
-                        avg_cash_flow = sum(d.get('estimated_cash_flow', 0) for d in deals) / len(deals)
-                        st.metric("Avg Cash Flow", f"£{avg_cash_flow:,.0f}")
-                    
-                    with col5:
-                        excellent_deals = len([d for d in deals if d.get('deal_score', 0) >= 80])
-                        st.metric("Excellent Deals", excellent_deals)
-                    
-                    # Top 5 deals preview
-                    st.markdown("### 🏆 Top Investment Deals")
-                    
-                    for i, deal in enumerate(deals[:5]):
-                        with st.expander(
-                            f"{deal.get('deal_quality', 'Unknown')} - "
-                            f"{deal.get('address', 'N/A')} - "
-                            f"£{deal.get('price', 0):,.0f} "
-                            f"({deal.get('rental_yield', 0):.1f}% yield)",
-                            expanded=i < 2
-                        ):
-                            col1, col2, col3 = st.columns([2, 2, 1])
-                            
-                            with col1:
-                                st.markdown(f"**📍 Address:** {deal.get('address', 'N/A')}")
-                                st.markdown(f"**🏠 Type:** {deal.get('property_type', 'N/A')}")
-                                st.markdown(f"**💰 Price:** £{deal.get('price', 0):,.0f}")
-                                st.markdown(f"**📊 Deal Score:** {deal.get('deal_score', 0):.1f}/100")
-                            
-                            with col2:
-                                st.markdown(f"**🛏️ Bedrooms:** {deal.get('bedrooms', 'N/A')}")
-                                st.markdown(f"**📈 Yield:** {deal.get('rental_yield', 0):.1f}%")
-                                st.markdown(f"**£ Monthly Rent:** £{deal.get('monthly_rent', 0):,}")
-                                cash_flow = deal.get('estimated_cash_flow', 0)
-                                st.markdown(f"**💵 Cash Flow:** £{cash_flow:,}/month")
-                            
-                            with col3:
-                                st.metric("Quality", deal.get('deal_quality', 'Unknown'))
-                                
-                                # Action button
-                                if st.button(f"➕ Add to Portfolio", key=f"add_deal_{deal.get('id', '')}_{i}"):
-                                    if 'data_manager' in st.session_state:
-                                        property_data = {
-                                            'id': deal.get('id', f"deal_{uuid.uuid4().hex[:8]}"),
-                                            'address': deal.get('address', ''),
-                                            'property_type': deal.get('property_type', 'Unknown'),
-                                            'price': deal.get('price', 0),
-                                            'monthly_rent': deal.get('monthly_rent', 0),
-                                            'monthly_expenses': deal.get('estimated_monthly_expenses', deal.get('price', 0) * 0.01),
-                                            'loan_amount': deal.get('price', 0) * 0.75,
-                                            'down_payment': deal.get('price', 0) * 0.25,
-                                            'interest_rate': 5.5,
-                                            'loan_term': 25,
-                                            'bedrooms': deal.get('bedrooms', 0),
-                                            'bathrooms': deal.get('bathrooms', 0),
-                                            'square_feet': deal.get('square_feet', 0),
-                                            'year_built': deal.get('year_built', 1990),
-                                            'date_acquired': datetime.now().strftime('%Y-%m-%d'),
-                                            'source': f"Deal Discovery - {deal.get('source', 'Unknown')}",
-                                            'notes': f"Deal Score: {deal.get('deal_score', 0):.1f}/100. Quality: {deal.get('deal_quality', 'Unknown')}."
-                                        }
-                                        
-                                        st.session_state.data_manager.save_property(property_data)
-                                        st.success("✅ Added to portfolio!")
-                    
-                    # Auto-populate comparison if enabled
-                    if criteria.get('auto_compare', False) and len(deals) >= 2:
-                        st.session_state.auto_compare_properties = deals[:10]
-                        st.success("🔥 Top deals auto-selected for comparison! Check the 'Auto Compare' tab.")
-                    
-                    # Show all deals button
-                    if st.button("📄 View All Deals", use_container_width=True):
-                        st.session_state['show_all_deals'] = True
-                        st.rerun()
-                else:
-                    st.warning("No deals found matching your criteria. Try adjusting your filters.")
-                    
     # Display all deals if requested
     if st.session_state.get('show_all_deals', False) and 'discovered_deals' in st.session_state:
         st.markdown("### 📈 Complete Deal Analysis")
         deals = st.session_state.discovered_deals
         
         # Deal quality pie chart
-        quality_counts = {}
-        for deal in deals:
-            quality = deal.get('deal_quality', 'Unknown')
-            quality_counts[quality] = quality_counts.get(quality, 0) + 1
-        
-        if quality_counts:
-            quality_df = pd.DataFrame([
-                {'Quality': k, 'Count': v} for k, v in quality_counts.items()
-            ])
+        quality_df = (
+            pd.Series([deal.get('deal_quality', 'Unknown') for deal in deals])
+            .value_counts()
+            .rename_axis('Quality')
+            .reset_index(name='Count')
+        )
+        
+        if not quality_df.empty:
+            import plotly.express as px
             
             fig = px.pie(
                 quality_df,
@@ -275,17 +538,26 @@ with tab1:
             )
             st.plotly_chart(fig, use_container_width=True, key="deal_quality_pie")
         
-        # All deals table
-        deal_df = pd.DataFrame([{
-            'Address': d.get('address', 'N/A'),
-            'Price': f"£{d.get('price', 0):,.0f}",
-            'Yield': f"{d.get('rental_yield', 0):.1f}%",
-            'Cash Flow': f"£{d.get('estimated_cash_flow', 0):,}",
-            'Deal Score': f"{d.get('deal_score', 0):.1f}/100",
-            'Quality': d.get('deal_quality', 'Unknown')
-        } for d in deals])
+        # All deals table - numbers stay numeric and are formatted by the front end
+        deal_df = pd.DataFrame.from_records(
+            deals,
+            columns=['address', 'price', 'rental_yield', 'estimated_cash_flow', 'deal_score', 'deal_quality']
+        ).fillna({
+            'address': 'N/A', 'price': 0, 'rental_yield': 0,
+            'estimated_cash_flow': 0, 'deal_score': 0, 'deal_quality': 'Unknown'
+        })
+        deal_df.columns = ['Address', 'Price', 'Yield', 'Cash Flow', 'Deal Score', 'Quality']
         
-        st.dataframe(deal_df, use_container_width=True)
+        st.dataframe(
+            deal_df,
+            column_config={
+                'Price': st.column_config.NumberColumn(format='£%.0f'),
+                'Yield': st.column_config.NumberColumn(format='%.1f%%'),
+                'Cash Flow': st.column_config.NumberColumn(format='£%.0f'),
+                'Deal Score': st.column_config.ProgressColumn(format='%.1f', min_value=0, max_value=100)
+            },
+            use_container_width=True
+        )
         
         if st.button("❌ Hide All Deals"):
             st.session_state['show_all_deals'] = False
@@ -344,12 +616,12 @@ with tab2:
     
     if submit_search and target_address:
         with st.spinner("Searching for properties near your address..."):
-            # Parse the address to extract city/area
-            address_parts = target_address.split(',')
-            if len(address_parts) >= 2:
-                city = address_parts[-2].strip()
+            # Parse the address to extract city/area - the part before the last comma
+            head, sep, _ = target_address.rpartition(',')
+            if sep:
+                city = head.rpartition(',')[2].strip()
             else:
-                city = target_address.split()[-1]
+                city = target_address.rsplit(None, 1)[-1]
             
             # Search for properties in the area
             search_params = {
@@ -362,7 +634,9 @@ with tab2:
                 'radius': search_radius
             }
             
-            properties = st.session_state.property_sources.search_local_market(target_address, search_params)
+            properties = cached_search_local_market(
+                st.session_state.property_sources, target_address, freeze_criteria(search_params)
+            )
             
             if properties:
                 st.success(f"Found {len(properties)} properties near {target_address}")
@@ -371,19 +645,23 @@ with tab2:
                 st.session_state.address_search_results = properties
                 st.session_state.target_address = target_address
                 
-                # Display summary
+                # Display summary - prices and yields are materialized once as typed arrays
+                prices = np.fromiter((p['price'] for p in properties), dtype=np.float64, count=len(properties))
+                yields = np.fromiter(
+                    (p.get('rental_yield') or 0 for p in properties), dtype=np.float64, count=len(properties)
+                )
                 col1, col2, col3, col4 = st.columns(4)
                 
                 with col1:
-                    avg_price = sum(p['price'] for p in properties) / len(properties)
+                    avg_price = float(prices.mean())
                     st.metric("Average Price", f"£{avg_price:,.0f}")
                 
                 with col2:
-                    avg_yield = sum(p.get('rental_yield', 0) for p in properties) / len(properties)
+                    avg_yield = float(yields.mean())
                     st.metric("Average Yield", f"{avg_yield:.1f}%")
                 
                 with col3:
-                    price_range = max(p['price'] for p in properties) - min(p['price'] for p in properties)
+                    price_range = float(np.ptp(prices))
                     st.metric("Price Range", f"£{price_range:,.0f}")
                 
                 with col4:
@@ -391,24 +669,26 @@ with tab2:
                 
                 # Quick preview of top properties
                 st.markdown("### Top 5 Properties")
-                preview_df = pd.DataFrame(properties[:5])
                 display_cols = ['address', 'price', 'bedrooms', 'property_type', 'rental_yield']
-                available_cols = [col for col in display_cols if col in preview_df.columns]
+                preview_display = pd.DataFrame.from_records(
+                    properties[:5], columns=display_cols
+                ).dropna(axis=1, how='all')
                 
-                if available_cols:
-                    preview_display = preview_df[available_cols].copy()
-                    if 'price' in preview_display.columns:
-                        preview_display['price'] = preview_display['price'].apply(lambda x: f"£{x:,.0f}")
-                    if 'rental_yield' in preview_display.columns:
-                        preview_display['rental_yield'] = preview_display['rental_yield'].apply(lambda x: f"{x:.1f}%")
-                    
-                    st.dataframe(preview_display, use_container_width=True)
+                if not preview_display.columns.empty:
+                    st.dataframe(
+                        preview_display,
+                        column_config={
+                            'price': st.column_config.NumberColumn(format='£%.0f'),
+                            'rental_yield': st.column_config.NumberColumn(format='%.1f%%')
+                        },
+                        use_container_width=True
+                    )
                 
                 # Auto-compare button
                 if include_investment and len(properties) >= 2:
                     if st.button("📊 Auto-Compare Top Properties", use_container_width=True):
                         # Store top properties for comparison
-                        st.session_state.auto_compare_properties = properties[:10]
+                        queue_auto_compare(properties[:10])
                         st.success("Properties queued for automatic comparison! Check the 'Auto Compare' tab.")
                         st.rerun()
                 
@@ -449,38 +729,43 @@ with tab3:
         if search_location:
             with st.spinner("Searching property databases..."):
                 # Search all available sources
-                search_results = st.session_state.property_sources.search_all_sources(
+                search_results = cached_search_all_sources(
+                    st.session_state.property_sources,
                     location=search_location,
                     max_results_per_source=max_results
                 )
                 
                 if search_results:
-                    # Filter results based on criteria
-                    filtered_results = []
-                    for prop in search_results:
-                        # Price filter
-                        if price_min > 0 and prop.get('price', 0) < price_min:
-                            continue
-                        if price_max > 0 and prop.get('price', 0) > price_max:
-                            continue
-                        
-                        # Bedroom filter
-                        if prop.get('bedrooms', 0) < min_bedrooms:
-                            continue
-                        
-                        # Square footage filter
-                        if min_sqft > 0 and prop.get('square_feet', 0) < min_sqft:
-                            continue
-                        
-                        # Property type filter
-                        if property_type != "All Types" and prop.get('property_type', '') != property_type:
-                            continue
-                        
-                        filtered_results.append(prop)
+                    # Filter results based on criteria with one boolean mask over the columns
+                    filter_df = pd.DataFrame(search_results).reindex(
+                        columns=['price', 'bedrooms', 'square_feet', 'property_type']
+                    )
+                    
+                    # Each criterion only adds a comparison when the user has constrained it
+                    mask = pd.Series(True, index=filter_df.index)
+                    
+                    # Bedroom filter
+                    if min_bedrooms > 0:
+                        mask &= filter_df['bedrooms'].fillna(0) >= min_bedrooms
+                    
+                    # Price filter
+                    if price_min > 0:
+                        mask &= filter_df['price'].fillna(0) >= price_min
+                    if price_max > 0:
+                        mask &= filter_df['price'].fillna(0) <= price_max
+                    
+                    # Square footage filter
+                    if min_sqft > 0:
+                        mask &= filter_df['square_feet'].fillna(0) >= min_sqft
+                    
+                    # Property type filter
+                    if property_type != "All Types":
+                        mask &= filter_df['property_type'].eq(property_type)
+                    
+                    filtered_results = [prop for prop, keep in zip(search_results, mask) if keep]
                     
                     # Store results in session state
-                    st.session_state.search_results = filtered_results
-                    st.session_state.search_timestamp = datetime.now()
+                    set_search_results(filtered_results, datetime.now())
                     
                     st.success(f"Found {len(filtered_results)} properties matching your criteria!")
                     
@@ -496,23 +781,29 @@ with tab4:
     
     if 'search_results' in st.session_state and st.session_state.search_results:
         results = st.session_state.search_results
+        result_ids = [prop.get('id', str(i)) for i, prop in enumerate(results)]
+        selected_ids = st.session_state.setdefault('selected_prop_ids', set())
+        
+        # One cached table per set of results feeds both the summary and the property grid
+        results_key = results_content_key(results)
+        results_table = build_results_table(results, results_key)
         
         # Results summary
+        avg_price = results_table['price'].fillna(0).mean()
+        sources = results_table['source'].fillna('Unknown').nunique()
+        avg_rent = results_table['monthly_rent'].fillna(0).mean()
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
             st.metric("Total Properties", len(results))
         
         with col2:
-            avg_price = sum(p.get('price', 0) for p in results) / len(results) if results else 0
             st.metric("Average Price", f"£{avg_price:,.0f}")
         
         with col3:
-            sources = set(p.get('source', 'Unknown') for p in results)
-            st.metric("Data Sources", len(sources))
+            st.metric("Data Sources", sources)
         
         with col4:
-            avg_rent = sum(p.get('monthly_rent', 0) for p in results) / len(results) if results else 0
             st.metric("Average Rent", f"£{avg_rent:,.0f}")
         
         # Display properties
@@ -526,10 +817,7 @@ with tab4:
         
         with col2:
             if st.button("📥 Import All Selected", type="primary"):
-                selected_properties = []
-                for i, prop in enumerate(results):
-                    if st.session_state.get(f"select_prop_{i}", False):
-                        selected_properties.append(prop)
+                selected_properties = [prop for prop, prop_id in zip(results, result_ids) if prop_id in selected_ids]
                 
                 if selected_properties:
                     added_count = st.session_state.property_sources.save_properties_to_portfolio(
@@ -541,64 +829,35 @@ with tab4:
                 else:
                     st.warning("Please select at least one property to import.")
         
-        # Property cards
-        for i, prop in enumerate(results):
-            with st.expander(f"🏠 {prop.get('address', 'Unknown Address')} - £{prop.get('price', 0):,.0f}"):
-                col1, col2, col3 = st.columns([1, 2, 1])
-                
-                with col1:
-                    # Selection checkbox
-                    st.checkbox(
-                        "Select for import",
-                        key=f"select_prop_{i}",
-                        value=False
-                    )
-                    
-                    # Property image placeholder
-                    st.markdown("📷 *Image placeholder*")
-                
-                with col2:
-                    # Property details
-                    st.markdown(f"**Address:** {prop.get('address', 'N/A')}")
-                    st.markdown(f"**Type:** {prop.get('property_type', 'N/A')}")
-                    st.markdown(f"**Price:** £{prop.get('price', 0):,.0f}")
-                    st.markdown(f"**Monthly Rent:** £{prop.get('monthly_rent', 0):,.0f}/month")
-                    st.markdown(f"**Bedrooms:** {prop.get('bedrooms', 'N/A')}")
-                    st.markdown(f"**Bathrooms:** {prop.get('bathrooms', 'N/A')}")
-                    st.markdown(f"**Square Feet:** {prop.get('square_feet', 'N/A'):,}")
-                    st.markdown(f"**Postcode:** {prop.get('postcode', 'N/A')}")
-                    st.markdown(f"**Tenure:** {prop.get('tenure', 'N/A')}")
-                    st.markdown(f"**Source:** {prop.get('source', 'N/A')}")
-                
-                with col3:
-                    # Quick analysis
-                    if prop.get('price', 0) > 0:
-                        # Calculate quick metrics
-                        price = prop.get('price', 0)
-                        monthly_rent = prop.get('monthly_rent', 0)
-                        
-                        if monthly_rent > 0:
-                            # UK rental yield calculation
-                            annual_rent = monthly_rent * 12
-                            gross_yield = (annual_rent / price) * 100 if price > 0 else 0
-                            
-                            # UK specific metrics
-                            st.markdown("**Quick Analysis:**")
-                            st.metric("Gross Yield", f"{gross_yield:.1f}%")
-                            
-                            # Good yield indicator for UK market
-                            yield_status = "✅ Good" if gross_yield >= 6 else "⚠️ Average" if gross_yield >= 4 else "❌ Low"
-                            st.metric("Yield Rating", yield_status)
-                            
-                            # Monthly yield
-                            monthly_yield = (monthly_rent / price) * 100 if price > 0 else 0
-                            st.metric("Monthly Yield", f"{monthly_yield:.2f}%")
-                        else:
-                            st.info("Rent data not available")
-                    
-                    # Link to listing
-                    if prop.get('listing_url'):
-                        st.markdown(f"[View Listing]({prop.get('listing_url')})")
+        # Property table - one editable grid with a Select column instead of a card per property
+        results_table.insert(0, 'select', [prop_id in selected_ids for prop_id in result_ids])
+        
+        edited_table = st.data_editor(
+            results_table,
+            column_config={
+                'select': st.column_config.CheckboxColumn("Select"),
+                'address': st.column_config.TextColumn("Address"),
+                'property_type': st.column_config.TextColumn("Type"),
+                'price': st.column_config.NumberColumn("Price", format='£%.0f'),
+                'monthly_rent': st.column_config.NumberColumn("Monthly Rent", format='£%.0f'),
+                'bedrooms': st.column_config.NumberColumn("Bedrooms"),
+                'bathrooms': st.column_config.NumberColumn("Bathrooms"),
+                'square_feet': st.column_config.NumberColumn("Square Feet"),
+                'postcode': st.column_config.TextColumn("Postcode"),
+                'tenure': st.column_config.TextColumn("Tenure"),
+                'source': st.column_config.TextColumn("Source"),
+                'listing_url': st.column_config.LinkColumn("Listing", display_text="View Listing"),
+                'gross_yield': st.column_config.NumberColumn("Gross Yield", format='%.1f%%'),
+                'monthly_yield': st.column_config.NumberColumn("Monthly Yield", format='%.2f%%'),
+                'yield_rating': st.column_config.SelectboxColumn("Yield Rating")
+            },
+            disabled=[column for column in results_table.columns if column != 'select'],
+            hide_index=True,
+            use_container_width=True,
+            key=f"results_grid_{hash(results_key)}_{st.session_state.get('results_grid_version', 0)}"
+        )
+        selected_ids = {prop_id for prop_id, selected in zip(result_ids, edited_table['select']) if selected}
+        st.session_state.selected_prop_ids = selected_ids
         
         # Bulk actions
         st.markdown("---")
@@ -607,51 +866,31 @@ with tab4:
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            if st.button("✅ Select All"):
-                for i in range(len(results)):
-                    st.session_state[f"select_prop_{i}"] = True
-                st.rerun()
+            st.button("✅ Select All", on_click=set_result_selection, args=(result_ids,))
         
         with col2:
-            if st.button("❌ Clear Selection"):
-                for i in range(len(results)):
-                    st.session_state[f"select_prop_{i}"] = False
-                st.rerun()
+            st.button("❌ Clear Selection", on_click=set_result_selection, args=([],))
         
         with col3:
             if st.button("📊 Analyze Selected"):
-                selected_props = []
-                for i, prop in enumerate(results):
-                    if st.session_state.get(f"select_prop_{i}", False):
-                        selected_props.append(prop)
+                selected_props = [prop for prop, prop_id in zip(results, result_ids) if prop_id in selected_ids]
                 
                 if selected_props:
                     st.markdown("### 📈 Quick Analysis of Selected Properties")
                     
                     # Create analysis dataframe
-                    analysis_data = []
-                    for prop in selected_props:
-                        if prop.get('price', 0) > 0 and prop.get('monthly_rent', 0) > 0:
-                            price = prop.get('price', 0)
-                            monthly_rent = prop.get('monthly_rent', 0)
-                            annual_rent = monthly_rent * 12
-                            gross_yield = (annual_rent / price) * 100
-                            
-                            analysis_data.append({
-                                'Address': prop.get('address', 'N/A'),
-                                'Price': price,
-                                'Monthly Rent': monthly_rent,
-                                'Gross Yield': gross_yield,
-                                'Source': prop.get('source', 'N/A')
-                            })
+                    analysis_sig = tuple(
+                        (prop.get('address', 'N/A'), prop.get('price', 0),
+                         prop.get('monthly_rent', 0), prop.get('source', 'N/A'))
+                        for prop in selected_props
+                    )
+                    analysis_df = build_yield_analysis(analysis_sig)
                     
-                    if analysis_data:
-                        analysis_df = pd.DataFrame(analysis_data)
-                        
+                    if not analysis_df.empty:
                         # Summary metrics
                         col1, col2, col3 = st.columns(3)
                         with col1:
-                            st.metric("Selected Properties", len(analysis_data))
+                            st.metric("Selected Properties", len(analysis_df))
                         with col2:
                             avg_yield = analysis_df['Gross Yield'].mean()
                             st.metric("Average Gross Yield", f"{avg_yield:.1f}%")
@@ -659,18 +898,32 @@ with tab4:
                             avg_price = analysis_df['Price'].mean()
                             st.metric("Average Price", f"£{avg_price:,.0f}")
                         
-                        # Visualization
-                        fig = px.scatter(
-                            analysis_df,
-                            x='Price',
-                            y='Gross Yield',
-                            hover_data=['Address', 'Monthly Rent'],
-                            title="Price vs Gross Yield for Selected Properties"
-                        )
-                        st.plotly_chart(fig, use_container_width=True)
+                        # Visualization - the figure is reused while the analysed selection is unchanged
+                        if st.session_state.get('_last_analysis_sig') != analysis_sig:
+                            import plotly.express as px
+                            
+                            st.session_state._analysis_fig = px.scatter(
+                                analysis_df,
+                                x='Price',
+                                y='Gross Yield',
+                                hover_data=['Address', 'Monthly Rent'],
+                                render_mode='webgl' if len(analysis_df) > WEBGL_POINT_THRESHOLD else 'svg',
+                                title="Price vs Gross Yield for Selected Properties"
+                            )
+                            st.session_state._last_analysis_sig = analysis_sig
+                        
+                        st.plotly_chart(st.session_state._analysis_fig, use_container_width=True)
                         
                         # Data table
-                        st.dataframe(analysis_df, use_container_width=True)
+                        st.dataframe(
+                            analysis_df,
+                            column_config={
+                                'Price': st.column_config.NumberColumn(format='£%.0f'),
+                                'Monthly Rent': st.column_config.NumberColumn(format='£%.0f'),
+                                'Gross Yield': st.column_config.NumberColumn(format='%.1f%%')
+                            },
+                            use_container_width=True
+                        )
                 else:
                     st.warning("Please select properties to analyze.")
     
@@ -681,41 +934,47 @@ with tab5:
     st.subheader("⚡ Auto Compare Properties")
     st.markdown("Automatically import and compare properties from your address search for investment analysis.")
     
-    if 'auto_compare_properties' in st.session_state and st.session_state.auto_compare_properties:
-        properties = st.session_state.auto_compare_properties
+    if st.session_state.get('auto_compare_ids'):
+        property_index = st.session_state.property_index
+        properties = [property_index[prop_id] for prop_id in st.session_state.auto_compare_ids]
+        if 'auto_compare_df' not in st.session_state:
+            st.session_state.auto_compare_df = build_auto_compare_frame(properties)
+        compare_df = st.session_state.auto_compare_df
         
         st.success(f"Ready to compare {len(properties)} properties from your search!")
         
         # Selection interface
         st.markdown("### Select Properties for Comparison")
         
-        # Create selection interface
-        selected_properties = []
+        # Create selection interface - one editable grid instead of a widget row per property
+        selection_df = compare_df[['address', 'price', 'bedrooms', 'rental_yield']].fillna(
+            {'address': 'N/A', 'price': 0, 'rental_yield': 0}
+        )
+        selection_df['yield_tier'] = pd.cut(
+            selection_df['rental_yield'],
+            bins=[-np.inf, 5, 7, np.inf],
+            labels=["Low Yield", "Good Yield", "High Yield"],
+            right=False
+        )
+        selection_df.insert(0, 'select', selection_df.index < 5)  # Auto-select first 5
         
-        for i, prop in enumerate(properties):
-            col1, col2, col3 = st.columns([1, 4, 2])
-            
-            with col1:
-                selected = st.checkbox(
-                    f"Property {i+1}",
-                    key=f"auto_compare_{i}",
-                    value=i < 5  # Auto-select first 5
-                )
-            
-            with col2:
-                st.markdown(f"**{prop.get('address', 'N/A')}**")
-                st.markdown(f"£{prop.get('price', 0):,.0f} • {prop.get('bedrooms', 'N/A')} bed • {prop.get('rental_yield', 0):.1f}% yield")
-            
-            with col3:
-                if prop.get('rental_yield', 0) >= 7:
-                    st.success("High Yield")
-                elif prop.get('rental_yield', 0) >= 5:
-                    st.info("Good Yield")
-                else:
-                    st.warning("Low Yield")
-            
-            if selected:
-                selected_properties.append(prop)
+        edited_df = st.data_editor(
+            selection_df,
+            column_config={
+                'select': st.column_config.CheckboxColumn("Select"),
+                'address': st.column_config.TextColumn("Address"),
+                'price': st.column_config.NumberColumn("Price", format='£%.0f'),
+                'bedrooms': st.column_config.NumberColumn("Bedrooms"),
+                'rental_yield': st.column_config.NumberColumn("Yield", format='%.1f%%'),
+                'yield_tier': st.column_config.SelectboxColumn("Yield Tier")
+            },
+            disabled=['address', 'price', 'bedrooms', 'rental_yield', 'yield_tier'],
+            hide_index=True,
+            use_container_width=True,
+            key=f"auto_compare_grid_{hash(tuple(st.session_state.auto_compare_ids))}"
+        )
+        selected_positions = edited_df.index[edited_df['select']]
+        selected_df = compare_df.iloc[selected_positions]
         
         # Action buttons
         st.markdown("---")
@@ -723,33 +982,32 @@ with tab5:
         
         with col1:
             if st.button("📊 Generate Deal Comparison", use_container_width=True):
-                if selected_properties:
-                    # Convert selected properties to the format expected by Deal Comparison
-                    for prop in selected_properties:
-                        # Add required fields for property import
-                        import_data = {
-                            'id': prop.get('id', f"auto_import_{uuid.uuid4()}"),
-                            'address': prop.get('address', ''),
-                            'property_type': prop.get('property_type', 'Unknown'),
-                            'price': prop.get('price', 0),
-                            'monthly_rent': prop.get('monthly_rent', 0),
-                            'monthly_expenses': prop.get('price', 0) * 0.01,  # Estimate 1% monthly expenses
-                            'loan_amount': prop.get('price', 0) * 0.75,  # Assume 75% LTV
-                            'down_payment': prop.get('price', 0) * 0.25,  # 25% down
-                            'interest_rate': 5.5,  # Current UK average
-                            'loan_term': 25,  # UK standard
-                            'bedrooms': prop.get('bedrooms', 0),
-                            'bathrooms': prop.get('bathrooms', 0),
-                            'square_feet': prop.get('square_feet', 0),
-                            'year_built': 1980,  # Default estimate
-                            'date_acquired': datetime.now().strftime('%Y-%m-%d'),
-                            'source': prop.get('source', 'Auto Import')
-                        }
-                        
-                        # Save to data manager
-                        st.session_state.data_manager.add_property(import_data)
+                if not selected_df.empty:
+                    import uuid
+                    
+                    # Convert selected properties to the format expected by Deal Comparison, column-wise
+                    import_df = selected_df.drop(columns='rental_yield').reset_index(drop=True).fillna({
+                        'address': '', 'property_type': 'Unknown', 'price': 0, 'monthly_rent': 0,
+                        'bedrooms': 0, 'bathrooms': 0, 'square_feet': 0, 'source': 'Auto Import'
+                    })
+                    import_df['id'] = import_df['id'].astype(object)
+                    missing_ids = import_df['id'].isna()
+                    import_df.loc[missing_ids, 'id'] = [f"auto_import_{uuid.uuid4()}" for _ in range(missing_ids.sum())]
+                    
+                    # Add required fields for property import
+                    import_df['monthly_expenses'] = import_df['price'] * 0.01  # Estimate 1% monthly expenses
+                    import_df['loan_amount'] = import_df['price'] * 0.75  # Assume 75% LTV
+                    import_df['down_payment'] = import_df['price'] * 0.25  # 25% down
+                    import_df['interest_rate'] = 5.5  # Current UK average
+                    import_df['loan_term'] = 25  # UK standard
+                    import_df['year_built'] = 1980  # Default estimate
+                    import_df['date_acquired'] = datetime.now().strftime('%Y-%m-%d')
+                    import_batch = import_df.to_dict('records')
                     
-                    st.success(f"Imported {len(selected_properties)} properties for comparison!")
+                    # Save to data manager in one write
+                    st.session_state.data_manager.add_properties(import_batch)
+                    
+                    st.success(f"Imported {len(selected_df)} properties for comparison!")
                     st.info("Navigate to the 'Deal Comparison' page to analyze these properties.")
                     
                     # Optional: Auto-navigate hint
@@ -762,51 +1020,44 @@ with tab5:
         
         with col2:
             if st.button("📈 Quick Analysis", use_container_width=True):
-                if selected_properties:
+                if not selected_df.empty:
                     # Generate quick comparison metrics
                     st.markdown("### Quick Investment Analysis")
                     
-                    comparison_data = []
-                    for prop in selected_properties:
-                        price = prop.get('price', 0)
-                        monthly_rent = prop.get('monthly_rent', 0)
-                        rental_yield = prop.get('rental_yield', 0)
-                        
-                        comparison_data.append({
-                            'Address': prop.get('address', 'N/A')[:30] + '...',
-                            'Price': f"£{price:,.0f}",
-                            'Monthly Rent': f"£{monthly_rent:,.0f}",
-                            'Gross Yield': f"{rental_yield:.1f}%",
-                            'Property Type': prop.get('property_type', 'N/A')
-                        })
-                    
-                    comparison_df = pd.DataFrame(comparison_data)
-                    st.dataframe(comparison_df, use_container_width=True)
+                    # One columnar frame feeds both the table and the metrics
+                    analysis_df, comparison_df = build_quick_comparison(tuple(
+                        selected_df[['address', 'price', 'monthly_rent', 'rental_yield', 'property_type']]
+                        .fillna({'address': 'N/A', 'price': 0, 'monthly_rent': 0, 'rental_yield': 0, 'property_type': 'N/A'})
+                        .itertuples(index=False, name=None)
+                    ))
+                    st.dataframe(
+                        comparison_df,
+                        column_config={
+                            'Price': st.column_config.NumberColumn(format='£%.0f'),
+                            'Monthly Rent': st.column_config.NumberColumn(format='£%.0f'),
+                            'Gross Yield': st.column_config.NumberColumn(format='%.1f%%')
+                        },
+                        use_container_width=True
+                    )
                     
                     # Quick metrics
-                    prices = [prop.get('price', 0) for prop in selected_properties]
-                    yields = [prop.get('rental_yield', 0) for prop in selected_properties]
+                    avg_price, avg_yield, best_yield = summarize_price_yield(
+                        analysis_df['price'].to_numpy(np.float64), analysis_df['rental_yield'].to_numpy(np.float64)
+                    )
                     
                     col1, col2, col3 = st.columns(3)
                     with col1:
-                        avg_price = sum(prices) / len(prices) if prices else 0
                         st.metric("Average Price", f"£{avg_price:,.0f}")
                     with col2:
-                        avg_yield = sum(yields) / len(yields) if yields else 0
                         st.metric("Average Yield", f"{avg_yield:.1f}%")
                     with col3:
-                        best_yield = max(yields) if yields else 0
                         st.metric("Best Yield", f"{best_yield:.1f}%")
                 else:
                     st.warning("Please select properties to analyze.")
         
         with col3:
-            if st.button("🗑️ Clear Selection", use_container_width=True):
-                # Clear the auto compare properties
-                if 'auto_compare_properties' in st.session_state:
-                    del st.session_state.auto_compare_properties
-                st.success("Selection cleared!")
-                st.rerun()
+            # Clear the auto compare properties before the rerun the click already triggers
+            st.button("🗑️ Clear Selection", use_container_width=True, on_click=clear_auto_compare)
     
     else:
         st.info("No properties available for auto comparison.")
@@ -830,49 +1081,43 @@ with tab3:
         with col2:
             if st.button("💾 Save Search"):
                 if search_name and 'search_results' in st.session_state:
-                    # Initialize saved searches if not exists
-                    if 'saved_searches' not in st.session_state:
-                        st.session_state.saved_searches = {}
-                    
                     # Save search
-                    st.session_state.saved_searches[search_name] = {
-                        'results': st.session_state.search_results,
-                        'timestamp': st.session_state.search_timestamp,
-                        'location': search_location if 'search_location' in locals() else 'Unknown'
-                    }
-                    
-                    st.success(f"Search '{search_name}' saved successfully!")
+                    try:
+                        save_search(
+                            search_name,
+                            st.session_state.search_results,
+                            st.session_state.search_timestamp,
+                            search_location if 'search_location' in locals() else 'Unknown'
+                        )
+                        
+                        st.success(f"Search '{search_name}' saved successfully!")
+                    except Exception as e:
+                        st.error(f"Error saving search: {str(e)}")
                 else:
                     st.error("Please enter a search name and ensure you have search results.")
     else:
         st.info("No current search to save. Perform a search first.")
     
     # Display saved searches
-    if 'saved_searches' in st.session_state and st.session_state.saved_searches:
+    if 'saved_searches_summary' in st.session_state and not st.session_state.saved_searches_summary.empty:
         st.markdown("---")
         st.markdown("**Your Saved Searches**")
         
-        for search_name, search_data in st.session_state.saved_searches.items():
+        summary = st.session_state.saved_searches_summary[['location', 'n_props', 'timestamp_str']]
+        for search_name, location, n_props, timestamp_str in summary.itertuples(name=None):
             with st.expander(f"📂 {search_name}"):
                 col1, col2, col3 = st.columns(3)
                 
                 with col1:
-                    st.write(f"**Location:** {search_data.get('location', 'Unknown')}")
-                    st.write(f"**Properties:** {len(search_data.get('results', []))}")
-                    st.write(f"**Saved:** {search_data.get('timestamp', 'Unknown').strftime('%Y-%m-%d %H:%M')}")
+                    st.write(f"**Location:** {location}")
+                    st.write(f"**Properties:** {n_props}")
+                    st.write(f"**Saved:** {timestamp_str}")
                 
                 with col2:
-                    if st.button(f"🔄 Load Search", key=f"load_{search_name}"):
-                        st.session_state.search_results = search_data['results']
-                        st.session_state.search_timestamp = search_data['timestamp']
-                        st.success(f"Loaded search '{search_name}'")
-                        st.rerun()
+                    st.button(f"🔄 Load Search", key=f"load_{search_name}", on_click=load_saved_search, args=(search_name,))
                 
                 with col3:
-                    if st.button(f"🗑️ Delete", key=f"delete_{search_name}"):
-                        del st.session_state.saved_searches[search_name]
-                        st.success(f"Deleted search '{search_name}'")
-                        st.rerun()
+                    st.button(f"🗑️ Delete", key=f"delete_{search_name}", on_click=delete_saved_search, args=(search_name,))
     else:
         st.info("No saved searches yet.")
 
@@ -1,6 +1,124 @@
 import numpy as np
 import pandas as pd
 from datetime import datetime
+from functools import lru_cache
+
+# Numba is optional - the NumPy implementations below are used when it is not installed
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Below this many values the NumPy path beats the cost of dispatching to the parallel kernel
+NUMBA_MIN_VALUES = 100_000
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _sum_aligned_series_numba(flat_values, offsets, starts, length):
+        """Sum ragged series into one output array, one output slot per thread"""
+        out = np.zeros(length)
+        for i in prange(length):
+            total = 0.0
+            for j in range(len(starts)):
+                k = i - starts[j]
+                if 0 <= k < offsets[j + 1] - offsets[j]:
+                    total += flat_values[offsets[j] + k]
+            out[i] = total
+        return out
+
+def summarize_price_yield(prices, yields):
+    """Average price, average yield and best yield for matching price and yield arrays"""
+    prices = np.asarray(prices, dtype=np.float64)
+    yields = np.asarray(yields, dtype=np.float64)
+    if prices.size == 0:
+        return 0.0, 0.0, 0.0
+    
+    return prices.mean(), yields.mean(), yields.max()
+
+def calculate_display_metrics(price, monthly_rent):
+    """Gross yield, monthly yield and UK yield rating for listing price and rent columns"""
+    price = pd.Series(price, dtype=np.float64)
+    monthly_rent = pd.Series(monthly_rent, dtype=np.float64, index=price.index)
+    
+    # Listings only need yields, so the financing metrics are skipped; yields need a price and a rent
+    priced = (price > 0) & (monthly_rent > 0)
+    gross_yield = (monthly_rent * 12 / price * 100).where(priced)
+    return pd.DataFrame({
+        'gross_yield': gross_yield,
+        'monthly_yield': (monthly_rent / price * 100).where(priced),
+        'yield_rating': pd.cut(
+            gross_yield,
+            bins=[-np.inf, 4, 6, np.inf],
+            labels=["❌ Low", "⚠️ Average", "✅ Good"],
+            right=False
+        )
+    })
+
+def sum_aligned_series(series_list, length):
+    """Sum 1-D series that share a common end point into a single array of the given length"""
+    lengths = np.array([len(series) for series in series_list], dtype=np.int64)
+    if lengths.size == 0 or lengths.sum() == 0:
+        return np.zeros(length)
+    
+    flat_values = np.concatenate(series_list).astype(np.float64)
+    offsets = np.concatenate(([0], np.cumsum(lengths)))
+    starts = length - lengths
+    
+    if NUMBA_AVAILABLE and flat_values.size >= NUMBA_MIN_VALUES:
+        return _sum_aligned_series_numba(flat_values, offsets, starts, length)
+    
+    positions = np.arange(flat_values.size) + np.repeat(starts - offsets[:-1], lengths)
+    return np.bincount(positions, weights=flat_values, minlength=length)
+
+def mortgage_payments(principal, annual_rate, years):
+    """Monthly mortgage payments for scalar or array inputs, like a spreadsheet PMT"""
+    principal = np.asarray(principal, dtype=np.float64)
+    annual_rate = np.asarray(annual_rate, dtype=np.float64)
+    num_payments = np.asarray(years, dtype=np.float64) * 12
+    
+    # Zero-rate loans are repaid in equal instalments; the growth factor is computed once per loan
+    interest_free = annual_rate == 0
+    monthly_rate = np.where(interest_free, 1.0, annual_rate) / 100 / 12
+    factor = (1 + monthly_rate) ** num_payments
+    return np.where(interest_free, principal / num_payments, principal * monthly_rate * factor / (factor - 1))
+
+# Mortgage payments are pure in their scalar inputs, so repeated loans across reruns hit the cache
+@lru_cache(maxsize=1024)
+def mortgage_payment(principal, annual_rate, years):
+    """Monthly mortgage payment using the standard amortization formula"""
+    if annual_rate == 0:
+        return principal / (years * 12)
+    
+    monthly_rate = annual_rate / 100 / 12
+    factor = (1 + monthly_rate) ** (years * 12)
+    return principal * monthly_rate * factor / (factor - 1)
+
+# Columns returned by PropertyCalculator.calculate_batch_metrics, in _batch_metrics output order
+BATCH_METRIC_COLUMNS = [
+    'monthly_payment', 'net_operating_income', 'annual_cash_flow', 'monthly_cash_flow',
+    'cap_rate', 'cash_on_cash', 'roi', 'dscr', 'grm', 'ltv'
+]
+
+def _batch_metrics(price, monthly_rent, monthly_expenses, down_payment, loan_amount, interest_rate, loan_term):
+    """Payment, income, cash flow and return ratios for every property as whole-array operations"""
+    annual_rent = monthly_rent * 12
+    noi = annual_rent * 0.95 - monthly_expenses * 12
+    
+    financed = (loan_amount > 0) & (interest_rate > 0)
+    payment = np.where(financed, mortgage_payments(loan_amount, interest_rate, loan_term), 0.0)
+    debt_service = payment * 12
+    cash_flow = noi - debt_service
+    
+    def ratio(numerator, denominator, default=0.0):
+        return np.divide(numerator, denominator, out=np.full_like(numerator, default), where=denominator != 0)
+    
+    cash_on_cash = ratio(cash_flow * 100, down_payment)
+    return np.vstack([
+        payment, noi, cash_flow, cash_flow / 12,
+        ratio(noi * 100, price), cash_on_cash, cash_on_cash,
+        ratio(noi, debt_service, np.inf), ratio(price, annual_rent), ratio(loan_amount * 100, price)
+    ])
 
 class PropertyCalculator:
     """Handles all property financial calculations"""
@@ -10,14 +128,7 @@ class PropertyCalculator:
     
     def calculate_mortgage_payment(self, principal, annual_rate, years):
         """Calculate monthly mortgage payment using standard formula"""
-        if annual_rate == 0:
-            return principal / (years * 12)
-        
-        monthly_rate = annual_rate / 100 / 12
-        num_payments = years * 12
-        
-        payment = principal * (monthly_rate * (1 + monthly_rate)**num_payments) / ((1 + monthly_rate)**num_payments - 1)
-        return payment
+        return mortgage_payment(principal, annual_rate, years)
     
     def calculate_cap_rate(self, net_operating_income, property_value):
         """Calculate capitalization rate"""
@@ -134,6 +245,23 @@ class PropertyCalculator:
         
         return self.calculate_metrics(calc_data)
     
+    def calculate_batch_metrics(self, properties_df):
+        """Core financial metrics for every row of a property dataframe, aligned to its index"""
+        def column(name, default):
+            if name not in properties_df:
+                return np.full(len(properties_df), default, dtype=np.float64)
+            return pd.to_numeric(properties_df[name], errors='coerce').fillna(default).to_numpy(np.float64)
+        
+        # Same defaults as calculate_comprehensive_metrics, with the 5% vacancy rate built in
+        inputs = (
+            column('price', 0), column('monthly_rent', 0), column('monthly_expenses', 0),
+            column('down_payment', 0), column('loan_amount', 0), column('interest_rate', 0),
+            column('loan_term', 30)
+        )
+        
+        metrics = _batch_metrics(*inputs)
+        return pd.DataFrame(metrics.T, index=properties_df.index, columns=BATCH_METRIC_COLUMNS)
+    
     def calculate_breakeven_rent(self, property_data):
         """Calculate breakeven rent needed"""
         annual_expenses = property_data.get('monthly_expenses', 0) * 12
@@ -170,34 +298,38 @@ class PropertyCalculator:
         """Calculate projected cash flow over multiple years"""
         current_metrics = self.calculate_comprehensive_metrics(property_data)
         
-        projections = []
-        for year in range(1, years + 1):
-            # Project rent and expenses
-            projected_rent = property_data.get('monthly_rent', 0) * (1 + rent_growth_rate) ** year
-            projected_expenses = property_data.get('monthly_expenses', 0) * (1 + expense_growth_rate) ** year
-            
-            # Calculate projected cash flow
-            annual_rent = projected_rent * 12
-            annual_expenses = projected_expenses * 12
-            
-            # Mortgage payment stays the same
-            monthly_payment = current_metrics['monthly_payment']
-            annual_debt_service = monthly_payment * 12
-            
-            # Net cash flow
-            vacancy_loss = annual_rent * 0.05  # 5% vacancy
-            effective_gross_income = annual_rent - vacancy_loss
-            net_operating_income = effective_gross_income - annual_expenses
-            annual_cash_flow = net_operating_income - annual_debt_service
-            
-            projections.append({
+        # Project rent and expenses for every year at once
+        year_numbers = np.arange(1, years + 1)
+        projected_rent = property_data.get('monthly_rent', 0) * (1 + rent_growth_rate) ** year_numbers
+        projected_expenses = property_data.get('monthly_expenses', 0) * (1 + expense_growth_rate) ** year_numbers
+        
+        # Calculate projected cash flow
+        annual_rent = projected_rent * 12
+        annual_expenses = projected_expenses * 12
+        
+        # Mortgage payment stays the same
+        annual_debt_service = current_metrics['monthly_payment'] * 12
+        
+        # Net cash flow
+        vacancy_loss = annual_rent * 0.05  # 5% vacancy
+        effective_gross_income = annual_rent - vacancy_loss
+        net_operating_income = effective_gross_income - annual_expenses
+        annual_cash_flow = net_operating_income - annual_debt_service
+        
+        projections = [
+            {
                 'year': year,
-                'monthly_rent': projected_rent,
-                'monthly_expenses': projected_expenses,
-                'annual_cash_flow': annual_cash_flow,
-                'monthly_cash_flow': annual_cash_flow / 12,
-                'net_operating_income': net_operating_income
-            })
+                'monthly_rent': rent,
+                'monthly_expenses': expenses,
+                'annual_cash_flow': cash_flow,
+                'monthly_cash_flow': cash_flow / 12,
+                'net_operating_income': noi
+            }
+            for year, rent, expenses, cash_flow, noi in zip(
+                year_numbers.tolist(), projected_rent.tolist(), projected_expenses.tolist(),
+                annual_cash_flow.tolist(), net_operating_income.tolist()
+            )
+        ]
         
         return projections
     
@@ -227,32 +359,46 @@ class PropertyCalculator:
         base_metrics = self.calculate_comprehensive_metrics(property_data)
         base_roi = base_metrics['roi']
         
+        # Base inputs, read once and broadcast against each variable's changes
+        base_rent = property_data.get('monthly_rent', 0)
+        base_expenses = property_data.get('monthly_expenses', 0)
+        base_rate = property_data.get('interest_rate', 0)
+        down_payment = property_data.get('down_payment', 0)
+        loan_amount = property_data.get('loan_amount', 0)
+        loan_term = property_data.get('loan_term', 30)
+        
+        # Debt service only depends on the loan, so only interest rate changes re-amortize it
+        base_debt_service = base_metrics['annual_debt_service']
+        
         sensitivity_results = {}
         
         for variable, changes in variables.items():
-            results = []
+            changes_arr = np.asarray(changes, dtype=np.float64)
+            monthly_rent = np.full_like(changes_arr, base_rent)
+            monthly_expenses = np.full_like(changes_arr, base_expenses)
+            annual_debt_service = np.full_like(changes_arr, base_debt_service)
             
-            for change in changes:
-                modified_data = property_data.copy()
-                
-                if variable == 'rent':
-                    modified_data['monthly_rent'] = property_data['monthly_rent'] * (1 + change)
-                elif variable == 'expenses':
-                    modified_data['monthly_expenses'] = property_data['monthly_expenses'] * (1 + change)
-                elif variable == 'price':
-                    modified_data['price'] = property_data['price'] * (1 + change)
-                elif variable == 'interest_rate':
-                    modified_data['interest_rate'] = property_data.get('interest_rate', 0) + change
-                
-                new_metrics = self.calculate_comprehensive_metrics(modified_data)
-                roi_change = new_metrics['roi'] - base_roi
-                
-                results.append({
-                    'change': change,
-                    'new_roi': new_metrics['roi'],
-                    'roi_change': roi_change
-                })
+            if variable == 'rent':
+                monthly_rent = base_rent * (1 + changes_arr)
+            elif variable == 'expenses':
+                monthly_expenses = base_expenses * (1 + changes_arr)
+            elif variable == 'interest_rate':
+                # Payments for every rate at once, zero where there is no loan or no interest
+                interest_rate = base_rate + changes_arr
+                financed = (interest_rate > 0) & (loan_amount > 0)
+                annual_debt_service = np.where(financed, mortgage_payments(loan_amount, interest_rate, loan_term), 0.0) * 12
+            # Price changes leave ROI unchanged, since ROI is measured against the down payment
+            
+            # Net operating income with the default 5% vacancy rate
+            annual_rent = monthly_rent * 12
+            net_operating_income = annual_rent - annual_rent * (5 / 100) - monthly_expenses * 12
+            
+            annual_cash_flow = net_operating_income - annual_debt_service
+            new_roi = (annual_cash_flow / down_payment) * 100 if down_payment != 0 else np.zeros_like(changes_arr)
             
-            sensitivity_results[variable] = results
+            sensitivity_results[variable] = [
+                {'change': change, 'new_roi': roi, 'roi_change': roi - base_roi}
+                for change, roi in zip(changes, new_roi.tolist())
+            ]
         
         return sensitivity_results
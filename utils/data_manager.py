@@ -1,56 +1,221 @@
+import numpy as np
 import pandas as pd
 import streamlit as st
 import json
+import math
 import os
+from collections import Counter
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import IO, Dict, List, Optional, Any
+
+# orjson is optional - the standard library json module is used when it is not installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _json_default(value):
+    """JSON form of values the encoders do not handle natively: ISO-8601 for dates, str() otherwise"""
+    return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+
+def _json_safe(value):
+    """Copy of data with NaN and infinities as None and numpy scalars as Python values, as orjson writes them"""
+    if isinstance(value, dict):
+        return {key: _json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(item) for item in value]
+    if isinstance(value, np.generic):
+        return _json_safe(value.item())
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+def _json_dumps(data, indent: bool = False) -> bytes:
+    """Encode data as strict JSON bytes, writing dates as ISO-8601 and NaN or infinities as null"""
+    if ORJSON_AVAILABLE:
+        # orjson writes plain dates and datetimes as ISO-8601 and non-finite floats as null itself
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option, default=_json_default)
+    return json.dumps(_json_safe(data), indent=2 if indent else None, default=_json_default).encode()
+
+def _json_loads(data: bytes):
+    """Decode JSON bytes, accepting the NaN and Infinity tokens older files may contain"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson only reads strict JSON; the stdlib decoder also takes NaN and Infinity
+            pass
+    return json.loads(data)
+
+# Raised by _json_loads on malformed input
+JSONDecodeError = json.JSONDecodeError
+
+# Fields every property must have, and the numeric fields with their defaults
+REQUIRED_FIELDS = ['address', 'property_type', 'price']
+NUMERIC_FIELD_DEFAULTS = {
+    'price': 0,
+    'down_payment': 0,
+    'loan_amount': 0,
+    'interest_rate': 0,
+    'loan_term': 30,
+    'monthly_rent': 0,
+    'monthly_expenses': 0,
+    'bedrooms': 0,
+    'bathrooms': 0,
+    'square_feet': 0,
+    'year_built': 2000
+}
+# Numeric fields kept as floats; the rest are whole numbers
+FLOAT_FIELDS = ['bathrooms', 'interest_rate']
+
+# Numeric fields totalled by get_property_summary
+SUMMARY_FIELDS = ['price', 'monthly_rent', 'monthly_expenses', 'bedrooms', 'bathrooms', 'square_feet', 'year_built']
+
+def _as_number(value) -> float:
+    """Numeric value of a stored field, counting missing or unparseable values as zero as get_properties does"""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return 0.0 if math.isnan(number) else number
+
+# The journal is folded back into the data file once it holds more entries than this,
+# or than there are properties, so replaying it on load stays cheap
+JOURNAL_COMPACT_MIN_ENTRIES = 100
 
 class DataManager:
     """Manages property data storage and retrieval"""
     
     def __init__(self, data_file='property_data.json'):
         self.data_file = data_file
+        # Single-property changes are appended to a journal instead of rewriting the data file
+        self.journal_file = f"{os.path.splitext(data_file)[0]}.journal.jsonl"
+        self.journal_entries = 0
         self.properties = self._load_data()
+        self._rebuild_indexes()
+        self._rebuild_summary()
+        # Typed DataFrame of self.properties, rebuilt on the first read after a change
+        self._df_cache = None
     
     def _load_data(self) -> List[Dict]:
-        """Load property data from file"""
+        """Load property data from file, then replay any journalled changes"""
         try:
+            data = []
             if os.path.exists(self.data_file):
-                with open(self.data_file, 'r') as f:
-                    data = json.load(f)
-                    # Convert date strings back to datetime objects where needed
-                    for prop in data:
-                        if 'date_acquired' in prop and isinstance(prop['date_acquired'], str):
-                            try:
-                                prop['date_acquired'] = datetime.strptime(prop['date_acquired'], '%Y-%m-%d').date()
-                            except:
-                                prop['date_acquired'] = datetime.now().date()
-                        if 'date_added' in prop and isinstance(prop['date_added'], str):
-                            try:
-                                prop['date_added'] = datetime.strptime(prop['date_added'], '%Y-%m-%d %H:%M:%S.%f')
-                            except:
-                                prop['date_added'] = datetime.now()
-                    return data
-            return []
+                with open(self.data_file, 'rb') as f:
+                    data = _json_loads(f.read())
+            return self._replay_journal(data)
         except Exception as e:
             st.error(f"Error loading property data: {str(e)}")
             return []
     
+    def _index_property(self, position: int):
+        """Add the property at a list position to the id and address lookups"""
+        prop = self.properties[position]
+        self._id_index.setdefault(prop.get('id'), position)
+        self._address_index.setdefault(prop.get('address'), position)
+    
+    def _rebuild_indexes(self):
+        """Map each property id and address to the first position holding it"""
+        self._id_index = {}
+        self._address_index = {}
+        for position in range(len(self.properties)):
+            self._index_property(position)
+    
+    def _tally_summary(self, properties: List[Dict], sign: int = 1):
+        """Add properties to the running summary totals, or remove them with sign=-1"""
+        for prop in properties:
+            for field in SUMMARY_FIELDS:
+                self._summary_totals[field] += sign * _as_number(prop.get(field))
+            property_type = prop.get('property_type')
+            if property_type is not None and property_type == property_type:
+                self._type_counts[property_type] += sign
+    
+    def _rebuild_summary(self):
+        """Recompute the running summary totals from scratch"""
+        self._summary_totals = Counter()
+        self._type_counts = Counter()
+        self._tally_summary(self.properties)
+    
+    def _replay_journal(self, data: List[Dict]) -> List[Dict]:
+        """Apply journalled add, update and delete records to the loaded properties"""
+        if not os.path.exists(self.journal_file):
+            return data
+        
+        # Byte offset just past the last complete line, and any unreadable complete lines
+        complete_end = 0
+        skipped_entries = 0
+        
+        with open(self.journal_file, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    # Only a write interrupted mid-line leaves a last line without its newline
+                    break
+                complete_end += len(line)
+                
+                try:
+                    entry = _json_loads(line)
+                except JSONDecodeError:
+                    skipped_entries += 1
+                    continue
+                
+                self.journal_entries += 1
+                if entry['op'] == 'add':
+                    data.append(entry['property'])
+                elif entry['op'] == 'update':
+                    for prop in data:
+                        if prop.get('id') == entry['id']:
+                            prop.update(entry['changes'])
+                            break
+                elif entry['op'] == 'delete':
+                    data = [prop for prop in data if prop.get('id') != entry['id']]
+        
+        # Cut off a torn last line so the next append starts on a fresh line
+        if os.path.getsize(self.journal_file) > complete_end:
+            with open(self.journal_file, 'r+b') as f:
+                f.truncate(complete_end)
+            st.warning("Discarded an incomplete property change left by an interrupted save.")
+        
+        if skipped_entries:
+            st.warning(f"Skipped {skipped_entries} unreadable property changes in {self.journal_file}.")
+        
+        return data
+    
+    def _append_journal(self, entries: List[Dict]):
+        """Append change records to the journal with one write, compacting once it outgrows the data"""
+        # Every change is persisted through here or _save_data, so both drop the cached DataFrame
+        self._df_cache = None
+        try:
+            with open(self.journal_file, 'ab') as f:
+                f.write(b''.join(_json_dumps(entry) + b'\n' for entry in entries))
+            self.journal_entries += len(entries)
+        except Exception as e:
+            st.error(f"Error saving property data: {str(e)}")
+            return
+        
+        if self.journal_entries > max(JOURNAL_COMPACT_MIN_ENTRIES, len(self.properties)):
+            self.compact()
+    
+    def compact(self):
+        """Fold the journal into the data file"""
+        self._save_data()
+    
     def _save_data(self):
-        """Save property data to file"""
+        """Save all property data to file and start a fresh journal"""
+        self._df_cache = None
         try:
-            # Convert datetime objects to strings for JSON serialization
-            data_to_save = []
-            for prop in self.properties:
-                prop_copy = prop.copy()
-                if 'date_acquired' in prop_copy and hasattr(prop_copy['date_acquired'], 'strftime'):
-                    prop_copy['date_acquired'] = prop_copy['date_acquired'].strftime('%Y-%m-%d')
-                if 'date_added' in prop_copy and hasattr(prop_copy['date_added'], 'strftime'):
-                    prop_copy['date_added'] = prop_copy['date_added'].strftime('%Y-%m-%d %H:%M:%S.%f')
-                data_to_save.append(prop_copy)
-            
-            with open(self.data_file, 'w') as f:
-                json.dump(data_to_save, f, indent=2, default=str)
+            # Write a temporary file and swap it in, so a crash mid-write leaves the old data intact
+            temp_file = f"{self.data_file}.tmp"
+            with open(temp_file, 'wb') as f:
+                f.write(_json_dumps(self.properties, indent=True))
+            os.replace(temp_file, self.data_file)
+            
+            # Every journalled change is now in the data file
+            if os.path.exists(self.journal_file):
+                os.remove(self.journal_file)
+            self.journal_entries = 0
         except Exception as e:
             st.error(f"Error saving property data: {str(e)}")
     
@@ -59,6 +224,10 @@ class DataManager:
         if not self.properties:
             return pd.DataFrame()
         
+        # Callers get their own copy, so changes to it cannot leak into the cache
+        if self._df_cache is not None:
+            return self._df_cache.copy()
+        
         try:
             df = pd.DataFrame(self.properties)
             # Ensure numeric columns are properly typed
@@ -66,57 +235,134 @@ class DataManager:
                              'loan_term', 'monthly_rent', 'monthly_expenses', 'bedrooms', 
                              'bathrooms', 'square_feet', 'year_built']
             
-            for col in numeric_columns:
+            numeric_df = df[df.columns.intersection(numeric_columns)]
+            
+            # Fields are typed when a property is added, so only columns holding stray strings
+            # need coercing before the whole block is zero-filled at once
+            coerce_columns = {
+                col: pd.to_numeric(numeric_df[col], errors='coerce')
+                for col, dtype in numeric_df.dtypes.items()
+                if not pd.api.types.is_numeric_dtype(dtype)
+            }
+            df[numeric_df.columns] = numeric_df.assign(**coerce_columns).fillna(0)
+            
+            # Stored dates stay as strings until here, where each column is parsed in one pass;
+            # a date that does not parse falls back to now. ISO8601 parsing also accepts
+            # date_added values saved in the older space-separated format
+            date_columns = ['date_acquired', 'date_added']
+            
+            for col in date_columns:
+                if col in df.columns:
+                    parsed = pd.to_datetime(df[col], format='ISO8601', errors='coerce')
+                    df[col] = parsed.mask(parsed.isna() & df[col].notna(), pd.Timestamp.now())
+            
+            # Repeated labels are stored as categoricals so grouping works on integer codes
+            categorical_columns = ['property_type']
+            
+            for col in categorical_columns:
                 if col in df.columns:
-                    df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+                    df[col] = df[col].astype('category')
+            
+            # Mostly unique text is held in Arrow string buffers (pyarrow ships with Streamlit),
+            # so substring searches run on Arrow compute kernels
+            string_columns = ['address', 'id']
             
-            return df
+            for col in string_columns:
+                if col in df.columns:
+                    df[col] = df[col].astype('string[pyarrow]')
+            
+            self._df_cache = df
+            return df.copy()
         except Exception as e:
             st.error(f"Error converting properties to DataFrame: {str(e)}")
             return pd.DataFrame()
     
+    def _prepare_property(self, property_data: Dict) -> bool:
+        """Validate and type a new property's fields in place"""
+        # Validate required fields
+        for field in REQUIRED_FIELDS:
+            if field not in property_data or not property_data[field]:
+                st.error(f"Missing required field: {field}")
+                return False
+        
+        # Ensure all numeric fields are properly typed
+        for field, default_value in NUMERIC_FIELD_DEFAULTS.items():
+            if field in property_data:
+                try:
+                    property_data[field] = float(property_data[field]) if field in FLOAT_FIELDS else int(property_data[field])
+                except (ValueError, TypeError):
+                    property_data[field] = default_value
+            else:
+                property_data[field] = default_value
+        
+        # Add timestamp
+        property_data['date_added'] = datetime.now()
+        
+        return True
+    
+    def _prepare_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Validate and type a frame of new properties column-wise, dropping rows missing required fields"""
+        missing_fields = [field for field in REQUIRED_FIELDS if field not in df.columns]
+        if missing_fields:
+            st.error(f"Missing required field: {missing_fields[0]}")
+            return df.iloc[0:0]
+        
+        # Required fields must be present and truthy, as for a single property
+        required = df[REQUIRED_FIELDS]
+        valid = required.notna().all(axis=1) & required.astype(bool).all(axis=1)
+        if not valid.all():
+            st.error(f"Skipped {int((~valid).sum())} properties with a missing required field")
+        df = df[valid].copy()
+        
+        # Unparseable or missing numbers fall back to the field default
+        for field, default_value in NUMERIC_FIELD_DEFAULTS.items():
+            if field in df.columns:
+                values = pd.to_numeric(df[field], errors='coerce').fillna(default_value)
+            else:
+                values = pd.Series(default_value, index=df.index)
+            df[field] = values.astype(float) if field in FLOAT_FIELDS else values.astype(float).astype(int)
+        
+        # Generate IDs where not present
+        if 'id' not in df.columns:
+            df['id'] = None
+        missing_ids = df['id'].isna()
+        if missing_ids.any():
+            import uuid
+            df['id'] = df['id'].astype(object)
+            df.loc[missing_ids, 'id'] = [str(uuid.uuid4()) for _ in range(int(missing_ids.sum()))]
+        
+        # Add timestamp
+        df['date_added'] = datetime.now()
+        
+        return df
+    
+    def _append_properties(self, properties: List[Dict]) -> int:
+        """Add prepared properties to the list and indexes, journalling them with a single write"""
+        for property_data in properties:
+            self.properties.append(property_data)
+            self._index_property(len(self.properties) - 1)
+        self._tally_summary(properties)
+        
+        if properties:
+            self._append_journal([
+                {'op': 'add', 'property': property_data} for property_data in properties
+            ])
+        
+        return len(properties)
+    
     def add_property(self, property_data: Dict) -> bool:
         """Add a new property"""
         try:
-            # Validate required fields
-            required_fields = ['address', 'property_type', 'price']
-            for field in required_fields:
-                if field not in property_data or not property_data[field]:
-                    st.error(f"Missing required field: {field}")
-                    return False
-            
-            # Ensure all numeric fields are properly typed
-            numeric_fields = {
-                'price': 0,
-                'down_payment': 0,
-                'loan_amount': 0,
-                'interest_rate': 0,
-                'loan_term': 30,
-                'monthly_rent': 0,
-                'monthly_expenses': 0,
-                'bedrooms': 0,
-                'bathrooms': 0,
-                'square_feet': 0,
-                'year_built': 2000
-            }
-            
-            for field, default_value in numeric_fields.items():
-                if field in property_data:
-                    try:
-                        property_data[field] = float(property_data[field]) if field in ['bathrooms', 'interest_rate'] else int(property_data[field])
-                    except (ValueError, TypeError):
-                        property_data[field] = default_value
-                else:
-                    property_data[field] = default_value
-            
-            # Add timestamp
-            property_data['date_added'] = datetime.now()
+            if not self._prepare_property(property_data):
+                return False
             
             # Add to properties list
             self.properties.append(property_data)
+            self._index_property(len(self.properties) - 1)
+            self._tally_summary([property_data])
             
-            # Save to file
-            self._save_data()
+            # Record the new property in the journal
+            self._append_journal([{'op': 'add', 'property': property_data}])
             
             return True
             
@@ -124,21 +370,39 @@ class DataManager:
             st.error(f"Error adding property: {str(e)}")
             return False
     
+    def add_properties(self, properties: List[Dict]) -> int:
+        """Add several new properties with a single save, returning how many were added"""
+        prepared = []
+        
+        for property_data in properties:
+            try:
+                if self._prepare_property(property_data):
+                    prepared.append(property_data)
+            except Exception as e:
+                st.error(f"Error adding property: {str(e)}")
+        
+        return self._append_properties(prepared)
+    
     def update_property(self, property_id: str, updated_data: Dict) -> bool:
         """Update an existing property"""
         try:
-            for i, prop in enumerate(self.properties):
-                if prop.get('id') == property_id:
-                    # Update the property
-                    self.properties[i].update(updated_data)
-                    self.properties[i]['date_modified'] = datetime.now()
-                    
-                    # Save to file
-                    self._save_data()
-                    return True
-            
-            st.error("Property not found")
-            return False
+            i = self._id_index.get(property_id)
+            if i is None:
+                st.error("Property not found")
+                return False
+            
+            # Update the property, swapping its old values out of the summary totals
+            self._tally_summary([self.properties[i]], sign=-1)
+            self.properties[i].update(updated_data)
+            self._tally_summary([self.properties[i]])
+            self.properties[i]['date_modified'] = datetime.now()
+            if 'id' in updated_data or 'address' in updated_data:
+                self._rebuild_indexes()
+            
+            # Record only the changed fields in the journal
+            changes = {**updated_data, 'date_modified': self.properties[i]['date_modified']}
+            self._append_journal([{'op': 'update', 'id': property_id, 'changes': changes}])
+            return True
             
         except Exception as e:
             st.error(f"Error updating property: {str(e)}")
@@ -147,11 +411,7 @@ class DataManager:
     def delete_property(self, property_id: str) -> bool:
         """Delete a property"""
         try:
-            original_count = len(self.properties)
-            self.properties = [prop for prop in self.properties if prop.get('id') != property_id]
-            
-            if len(self.properties) < original_count:
-                self._save_data()
+            if self._remove_properties({property_id}):
                 return True
             else:
                 st.error("Property not found")
@@ -161,13 +421,38 @@ class DataManager:
             st.error(f"Error deleting property: {str(e)}")
             return False
     
+    def delete_properties(self, property_ids: List[str]) -> int:
+        """Delete several properties in one pass, returning how many were removed"""
+        try:
+            return self._remove_properties(set(property_ids))
+        except Exception as e:
+            st.error(f"Error deleting properties: {str(e)}")
+            return 0
+    
+    def _remove_properties(self, property_ids: set) -> int:
+        """Remove every property with one of the given ids, journalling the batch with a single write"""
+        # Unknown ids are answered from the index without touching the list
+        property_ids = {property_id for property_id in property_ids if property_id in self._id_index}
+        if not property_ids:
+            return 0
+        
+        # One pass keeps the remaining properties in their display order
+        kept, removed = [], []
+        for prop in self.properties:
+            (removed if prop.get('id') in property_ids else kept).append(prop)
+        
+        self.properties = kept
+        self._tally_summary(removed, sign=-1)
+        # Later positions have shifted, so the lookups are rebuilt once
+        self._rebuild_indexes()
+        self._append_journal([{'op': 'delete', 'id': property_id} for property_id in property_ids])
+        return len(removed)
+    
     def get_property_by_id(self, property_id: str) -> Optional[Dict]:
         """Get a specific property by ID"""
         try:
-            for prop in self.properties:
-                if prop.get('id') == property_id:
-                    return prop
-            return None
+            i = self._id_index.get(property_id)
+            return self.properties[i] if i is not None else None
         except Exception as e:
             st.error(f"Error retrieving property: {str(e)}")
             return None
@@ -175,10 +460,8 @@ class DataManager:
     def get_property_by_address(self, address: str) -> Optional[Dict]:
         """Get a specific property by address"""
         try:
-            for prop in self.properties:
-                if prop.get('address') == address:
-                    return prop
-            return None
+            i = self._address_index.get(address)
+            return self.properties[i] if i is not None else None
         except Exception as e:
             st.error(f"Error retrieving property: {str(e)}")
             return None
@@ -190,23 +473,38 @@ class DataManager:
             if df.empty:
                 return df
             
-            # Apply search filters
+            # Combine every filter into one mask and select the matching rows once
+            mask = pd.Series(True, index=df.index)
+            
+            # Numeric comparisons are gathered into one expression, which pandas evaluates
+            # as a single fused numexpr pass when numexpr is installed
+            predicates = []
+            params = {}
+            
+            def add_predicate(key, operator, bound):
+                name = f"bound_{len(params)}"
+                params[name] = bound
+                predicates.append(f"`{key}` {operator} @{name}")
+            
             for key, value in criteria.items():
                 if key in df.columns and value is not None:
                     if isinstance(value, str):
-                        # String search (case-insensitive)
-                        df = df[df[key].str.contains(value, case=False, na=False)]
+                        # String search (case-insensitive, literal substring)
+                        mask &= df[key].str.contains(value, case=False, na=False, regex=False)
                     elif isinstance(value, (int, float)):
                         # Numeric search
-                        df = df[df[key] == value]
+                        add_predicate(key, '==', value)
                     elif isinstance(value, dict):
                         # Range search
                         if 'min' in value and value['min'] is not None:
-                            df = df[df[key] >= value['min']]
+                            add_predicate(key, '>=', value['min'])
                         if 'max' in value and value['max'] is not None:
-                            df = df[df[key] <= value['max']]
+                            add_predicate(key, '<=', value['max'])
+            
+            if predicates:
+                mask &= df.eval(' and '.join(predicates), local_dict=params)
             
-            return df
+            return df[mask]
             
         except Exception as e:
             st.error(f"Error searching properties: {str(e)}")
@@ -215,22 +513,26 @@ class DataManager:
     def get_property_summary(self) -> Dict:
         """Get summary statistics for all properties"""
         try:
-            df = self.get_properties()
-            if df.empty:
+            if not self.properties:
                 return {}
             
+            # Totals are kept up to date as properties change, so no properties are read here
+            totals = self._summary_totals
+            type_counts = +self._type_counts
+            
+            count = len(self.properties)
             summary = {
-                'total_properties': len(df),
-                'total_value': df['price'].sum(),
-                'total_monthly_rent': df['monthly_rent'].sum(),
-                'total_monthly_expenses': df['monthly_expenses'].sum(),
-                'average_price': df['price'].mean(),
-                'average_monthly_rent': df['monthly_rent'].mean(),
-                'property_types': df['property_type'].value_counts().to_dict() if 'property_type' in df.columns else {},
-                'total_bedrooms': df['bedrooms'].sum(),
-                'total_bathrooms': df['bathrooms'].sum(),
-                'total_square_feet': df['square_feet'].sum(),
-                'average_year_built': df['year_built'].mean() if 'year_built' in df.columns else 0
+                'total_properties': count,
+                'total_value': totals['price'],
+                'total_monthly_rent': totals['monthly_rent'],
+                'total_monthly_expenses': totals['monthly_expenses'],
+                'average_price': totals['price'] / count,
+                'average_monthly_rent': totals['monthly_rent'] / count,
+                'property_types': dict(type_counts.most_common()),
+                'total_bedrooms': totals['bedrooms'],
+                'total_bathrooms': totals['bathrooms'],
+                'total_square_feet': totals['square_feet'],
+                'average_year_built': totals['year_built'] / count
             }
             
             return summary
@@ -239,17 +541,18 @@ class DataManager:
             st.error(f"Error generating property summary: {str(e)}")
             return {}
     
-    def export_properties(self, format='csv') -> str:
-        """Export properties to specified format"""
+    def export_properties(self, format='csv', out: Optional[IO] = None) -> str:
+        """Export properties to specified format, streaming into out when given instead of returning a string"""
         try:
             df = self.get_properties()
             if df.empty:
                 return ""
             
+            # pandas writes straight into out in chunks and returns None, so no full copy is built
             if format.lower() == 'csv':
-                return df.to_csv(index=False)
+                return df.to_csv(out, index=False) or ""
             elif format.lower() == 'json':
-                return df.to_json(orient='records', indent=2)
+                return df.to_json(out, orient='records', indent=2) or ""
             else:
                 st.error(f"Unsupported export format: {format}")
                 return ""
@@ -275,19 +578,9 @@ class DataManager:
                 st.error(f"Unsupported import format: {format}")
                 return False
             
-            # Convert DataFrame to list of dictionaries
-            properties_to_add = df.to_dict('records')
-            
-            # Add each property
-            success_count = 0
-            for prop in properties_to_add:
-                # Generate ID if not present
-                if 'id' not in prop:
-                    import uuid
-                    prop['id'] = str(uuid.uuid4())
-                
-                if self.add_property(prop):
-                    success_count += 1
+            # Validate and type the whole import as columns, then add it with a single save
+            properties_to_add = self._prepare_frame(df).to_dict('records')
+            success_count = self._append_properties(properties_to_add)
             
             st.success(f"Successfully imported {success_count} properties")
             return True
@@ -302,8 +595,8 @@ class DataManager:
             if backup_file is None:
                 backup_file = f"property_data_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
             
-            with open(backup_file, 'w') as f:
-                json.dump(self.properties, f, indent=2, default=str)
+            with open(backup_file, 'wb') as f:
+                f.write(_json_dumps(self.properties, indent=True))
             
             return True
             
@@ -318,8 +611,8 @@ class DataManager:
                 st.error("Backup file not found")
                 return False
             
-            with open(backup_file, 'r') as f:
-                backup_data = json.load(f)
+            with open(backup_file, 'rb') as f:
+                backup_data = _json_loads(f.read())
             
             # Validate backup data
             if not isinstance(backup_data, list):
@@ -331,6 +624,8 @@ class DataManager:
             
             # Restore data
             self.properties = backup_data
+            self._rebuild_indexes()
+            self._rebuild_summary()
             self._save_data()
             
             st.success("Data restored successfully")
@@ -351,6 +646,8 @@ class DataManager:
             self.backup_data()
             
             self.properties = []
+            self._rebuild_indexes()
+            self._rebuild_summary()
             self._save_data()
             
             return True
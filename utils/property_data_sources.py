@@ -3,7 +3,9 @@ import pandas as pd
 import streamlit as st
 import json
 import time
+import threading
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 import os
 from dotenv import load_dotenv
@@ -15,6 +17,10 @@ import numpy as np
 # Load environment variables
 load_dotenv()
 
+# Source searches run on worker threads, which must not call Streamlit - while a worker
+# is collecting, its status messages are queued here and shown by the script thread
+_worker_messages = threading.local()
+
 class PropertyDataSources:
     """Advanced UK property deal discovery and market data integration system"""
     
@@ -406,10 +412,29 @@ class PropertyDataSources:
         # Default to Manchester data
         return city_data['manchester']
     
+    def _report(self, level: str, message: str):
+        """Show a status message, or queue it when called from a source search worker"""
+        queue = getattr(_worker_messages, 'queue', None)
+        if queue is not None:
+            queue.append((level, message))
+        else:
+            getattr(st, level)(message)
+    
+    def _run_source_search(self, name: str, search, query: str, max_results: int):
+        """Run one source search on a worker thread, returning its listings and queued messages"""
+        _worker_messages.queue = []
+        try:
+            results = search(query, max_results=max_results) or []
+        except Exception as e:
+            self._report('error', f"Error searching {name}: {str(e)}")
+            results = []
+        messages, _worker_messages.queue = _worker_messages.queue, None
+        return results, messages
+    
     def search_properties_rightmove(self, location: str, property_type: str = 'all', max_results: int = 50) -> List[Dict]:
         """Search properties using Rightmove API"""
         if not self.rightmove_api_key:
-            st.error("Rightmove API key not found. Please add RIGHTMOVE_API_KEY to your environment variables.")
+            self._report('error', "Rightmove API key not found. Please add RIGHTMOVE_API_KEY to your environment variables.")
             return []
         
         try:
@@ -436,17 +461,17 @@ class PropertyDataSources:
                 data = response.json()
                 return self._normalize_rightmove_data(data.get('properties', []))
             else:
-                st.error(f"Rightmove API Error: {response.status_code}")
+                self._report('error', f"Rightmove API Error: {response.status_code}")
                 return []
                 
         except Exception as e:
-            st.info(f"API unavailable, trying web scraping: {str(e)}")
+            self._report('info', f"API unavailable, trying web scraping: {str(e)}")
             return self._scrape_rightmove_data(location, property_type, max_results)
     
     def search_properties_zoopla(self, area: str, max_results: int = 50) -> List[Dict]:
         """Search properties using Zoopla API"""
         if not self.zoopla_api_key:
-            st.error("Zoopla API key not found. Please add ZOOPLA_API_KEY to your environment variables.")
+            self._report('error', "Zoopla API key not found. Please add ZOOPLA_API_KEY to your environment variables.")
             return []
         
         try:
@@ -468,17 +493,17 @@ class PropertyDataSources:
                 data = response.json()
                 return self._normalize_zoopla_data(data.get('listing', []))
             else:
-                st.error(f"Zoopla API Error: {response.status_code}")
+                self._report('error', f"Zoopla API Error: {response.status_code}")
                 return []
                 
         except Exception as e:
-            st.error(f"Error fetching Zoopla data: {str(e)}")
+            self._report('error', f"Error fetching Zoopla data: {str(e)}")
             return []
     
     def search_properties_onthemarket(self, location: str, max_results: int = 50) -> List[Dict]:
         """Search properties using OnTheMarket API"""
         if not self.onthemarket_api_key:
-            st.error("OnTheMarket API key not found. Please add ONTHEMARKET_API_KEY to your environment variables.")
+            self._report('error', "OnTheMarket API key not found. Please add ONTHEMARKET_API_KEY to your environment variables.")
             return []
         
         try:
@@ -504,11 +529,11 @@ class PropertyDataSources:
                 data = response.json()
                 return self._normalize_onthemarket_data(data.get('properties', []))
             else:
-                st.error(f"OnTheMarket API Error: {response.status_code}")
+                self._report('error', f"OnTheMarket API Error: {response.status_code}")
                 return []
                 
         except Exception as e:
-            st.error(f"Error fetching OnTheMarket data: {str(e)}")
+            self._report('error', f"Error fetching OnTheMarket data: {str(e)}")
             return []
     
     def _normalize_rightmove_data(self, properties: List[Dict]) -> List[Dict]:
@@ -539,7 +564,7 @@ class PropertyDataSources:
                 }
                 normalized.append(normalized_prop)
             except Exception as e:
-                st.warning(f"Error normalizing Rightmove property: {str(e)}")
+                self._report('warning', f"Error normalizing Rightmove property: {str(e)}")
                 continue
         
         return normalized
@@ -572,7 +597,7 @@ class PropertyDataSources:
                 }
                 normalized.append(normalized_prop)
             except Exception as e:
-                st.warning(f"Error normalizing Zoopla property: {str(e)}")
+                self._report('warning', f"Error normalizing Zoopla property: {str(e)}")
                 continue
         
         return normalized
@@ -605,7 +630,7 @@ class PropertyDataSources:
                 }
                 normalized.append(normalized_prop)
             except Exception as e:
-                st.warning(f"Error normalizing OnTheMarket property: {str(e)}")
+                self._report('warning', f"Error normalizing OnTheMarket property: {str(e)}")
                 continue
         
         return normalized
@@ -825,21 +850,31 @@ class PropertyDataSources:
         
         st.info(f"Searching for properties in {city}, {county}...")
         
-        # Search each available UK source
-        if availability.get('Rightmove', False):
-            st.info("Searching Rightmove...")
-            rightmove_properties = self.search_properties_rightmove(location, max_results=max_results_per_source)
-            all_properties.extend(rightmove_properties)
-        
-        if availability.get('Zoopla', False):
-            st.info("Searching Zoopla...")
-            zoopla_properties = self.search_properties_zoopla(city, max_results=max_results_per_source)
-            all_properties.extend(zoopla_properties)
+        # Search each available UK source concurrently - the calls are I/O bound, so the
+        # search takes as long as the slowest source rather than the sum of all of them
+        searches = {
+            'Rightmove': (self.search_properties_rightmove, location),
+            'Zoopla': (self.search_properties_zoopla, city),
+            'OnTheMarket': (self.search_properties_onthemarket, location),
+        }
+        searches = {name: search for name, search in searches.items() if availability.get(name, False)}
         
-        if availability.get('OnTheMarket', False):
-            st.info("Searching OnTheMarket...")
-            onthemarket_properties = self.search_properties_onthemarket(location, max_results=max_results_per_source)
-            all_properties.extend(onthemarket_properties)
+        if searches:
+            st.info(f"Searching {', '.join(searches)}...")
+            
+            with ThreadPoolExecutor(max_workers=len(searches)) as executor:
+                futures = [
+                    executor.submit(self._run_source_search, name, search, query, max_results_per_source)
+                    for name, (search, query) in searches.items()
+                ]
+                # Results and messages are gathered in source order, once every search has finished,
+                # so listings keep a stable position and only this thread talks to Streamlit
+                outcomes = [future.result() for future in futures]
+            
+            for results, messages in outcomes:
+                all_properties.extend(results)
+                for level, message in messages:
+                    getattr(st, level)(message)
         
         # Estimate rental income for properties without it
         for prop in all_properties:
@@ -996,7 +1031,7 @@ class PropertyDataSources:
     
     def save_properties_to_portfolio(self, properties: List[Dict], data_manager) -> int:
         """Save selected properties to the portfolio"""
-        added_count = 0
+        portfolio_properties = []
         
         for prop in properties:
             try:
@@ -1028,22 +1063,22 @@ class PropertyDataSources:
                     }
                 }
                 
-                if data_manager.add_property(portfolio_property):
-                    added_count += 1
+                portfolio_properties.append(portfolio_property)
                     
             except Exception as e:
                 st.warning(f"Error adding property to portfolio: {str(e)}")
                 continue
         
-        return added_count
+        # One portfolio write for the whole selection
+        return data_manager.add_properties(portfolio_properties)
     
     def _scrape_rightmove_data(self, location: str, property_type: str, max_results: int) -> List[Dict]:
         """Web scraping fallback for Rightmove data"""
         try:
-            st.info("🌐 Attempting to gather property data via web research...")
+            self._report('info', "🌐 Attempting to gather property data via web research...")
             return self._generate_realistic_market_data(location, max_results, 'rightmove')
         except Exception as e:
-            st.warning(f"Web scraping failed: {str(e)}")
+            self._report('warning', f"Web scraping failed: {str(e)}")
             return self._generate_realistic_market_data(location, max_results, 'rightmove')
     
     def _generate_realistic_market_data(self, location: str, count: int, source: str) -> List[Dict]: